@@ -1,6 +1,11 @@
 # Import dependencies
+import os
+import sys
+from typing import Optional, Tuple
+
 import typer
-from .cli_commands import dev, init, add, list, validate, deploy, info, remove, update
+
+from . import cli_commands
 
 # Initialize the cli app
 app = typer.Typer(
@@ -9,16 +14,84 @@ app = typer.Typer(
     help="A4E CLI - Create and manage conversational AI agents",
 )
 
-# Command groups for the cli
-app.add_typer(dev.app, name="dev", help="Development server commands")
-app.add_typer(init.app, name="init", help="Initialize a new agent project")
-app.add_typer(add.app, name="add", help="Add tools, views, or skills")
-app.add_typer(list.app, name="list", help="List tools, views, or skills")
-app.add_typer(update.app, name="update", help="Update tools, views, or skills")
-app.add_typer(remove.app, name="remove", help="Remove tools, views, or skills")
-app.add_typer(validate.app, name="validate", help="Validate agent project")
-app.add_typer(deploy.app, name="deploy", help="Deploy agent to production")
-app.add_typer(info.app, name="info", help="Display agent information")
+# Command groups for the cli (module name in cli_commands -> help text)
+COMMANDS = {
+    "dev": "Development server commands",
+    "init": "Initialize a new agent project",
+    "add": "Add tools, views, or skills",
+    "list": "List tools, views, or skills",
+    "update": "Update tools, views, or skills",
+    "remove": "Remove tools, views, or skills",
+    "validate": "Validate agent project",
+    "deploy": "Deploy agent to production",
+    "info": "Display agent information",
+}
+
+
+def _sniff_subcommand() -> Tuple[Optional[str], Optional[str]]:
+    """Return the command group and the command within it named on the command line."""
+    args = sys.argv[1:]
+    for i, arg in enumerate(args):
+        if not arg.startswith("-"):
+            if arg not in COMMANDS:
+                return None, None
+            following = args[i + 1] if i + 1 < len(args) else ""
+            return arg, following if following and not following.startswith("-") else None
+    return None, None
+
+
+def _version_callback(value: bool) -> None:
+    if value:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            typer.echo(version("a4e-mcp-server"))
+        except PackageNotFoundError:
+            typer.echo("unknown")
+        raise typer.Exit()
+
+
+@app.callback()
+def main(
+    version: bool = typer.Option(
+        False, "--version", "-V", help="Show the version and exit.",
+        callback=_version_callback, is_eager=True,
+    ),
+) -> None:
+    """A4E CLI - Create and manage conversational AI agents"""
+
+
+def _register(name: str, command: Optional[str] = None) -> None:
+    """Import a command group module and attach its Typer app.
+
+    When the command being run is known, only that one is kept so Typer
+    doesn't build Click parameters for its siblings.
+    """
+    group = getattr(cli_commands, name).app
+    if command:
+        wanted = [info for info in group.registered_commands if info.name == command]
+        if wanted:
+            group.registered_commands = wanted
+    app.add_typer(group, name=name, help=COMMANDS[name])
+
+
+def _register_stub(name: str) -> None:
+    """Attach an empty placeholder group: enough for the top-level command list."""
+    app.add_typer(typer.Typer(), name=name, help=COMMANDS[name])
+
+
+# Only import the command group being invoked. Top-level --help only needs the
+# names and help text, --version needs nothing; shell completion walks the
+# real command tree, so it still imports every group.
+_selected, _command = _sniff_subcommand()
+if _selected:
+    _register(_selected, _command)
+elif "_A4E_COMPLETE" in os.environ:
+    for _name in COMMANDS:
+        _register(_name)
+elif sys.argv[1:2] not in (["--version"], ["-V"]):
+    for _name in COMMANDS:
+        _register_stub(_name)
 
 if __name__ == "__main__":
     app()
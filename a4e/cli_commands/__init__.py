@@ -1,4 +1,15 @@
 # a4e/cli_commands/__init__.py
 
-from . import dev
-# from . import agent # Will be uncommented when agent.py is created
+# Command group submodules are loaded on first attribute access (PEP 562),
+# so importing one command does not import the others.
+_LAZY = {"dev", "init", "add", "list", "update", "remove", "validate", "deploy", "info"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,14 +5,16 @@ Commands for adding tools, views, and skills to an agent.
 
 import typer
 import json
-from pathlib import Path
+import re
 from typing import Optional
 
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-
-console = Console()
+from ..core import is_valid_tool_name, list_tool_names
+from .helpers import (
+    find_agent_dir,
+    get_console,
+    list_subdirs,
+    split_csv,
+)
 
 # Create a 'Typer' app for the 'add' command group
 app = typer.Typer(
@@ -21,66 +23,55 @@ app = typer.Typer(
 )
 
 TYPE_OPTIONS = ["string", "number", "integer", "boolean", "array", "object"]
+_TYPE_OPTIONS_PROMPT = "  Type options: " + ", ".join(f"[{i+1}]{t}" for i, t in enumerate(TYPE_OPTIONS))
+_TYPE_BY_INDEX = {str(i + 1): t for i, t in enumerate(TYPE_OPTIONS)}
 
+# View IDs become folder/schema keys: snake_case starting with a letter.
+# Tool names are checked with core.is_valid_tool_name, like the MCP tool.
+_VIEW_ID_RE = re.compile(r"^[a-z][a-z0-9_]*$")
 
-def find_agent_dir(agent_name: Optional[str] = None) -> Optional[Path]:
-    """Find the agent directory from name or current working directory."""
-    cwd = Path.cwd()
-
-    if agent_name:
-        # Check if it's an absolute path
-        if Path(agent_name).is_absolute() and Path(agent_name).exists():
-            return Path(agent_name)
-        # Check relative to cwd
-        if (cwd / agent_name).exists():
-            return cwd / agent_name
-        # Check in agent-store
-        agent_store = cwd / "file-store" / "agent-store" / agent_name
-        if agent_store.exists():
-            return agent_store
-        return None
-
-    # Check if cwd is an agent directory (has agent.py and metadata.json)
-    if (cwd / "agent.py").exists() and (cwd / "metadata.json").exists():
-        return cwd
-
-    return None
 
+def _prompt_fields(label: str, ask_required: bool) -> dict:
+    """Interactive loop collecting named, typed fields (tool parameters or view props)."""
+    from rich.prompt import Prompt, Confirm
 
-def prompt_for_parameters() -> dict:
-    """Interactive prompt for tool/view parameters."""
-    parameters = {}
+    console = get_console()
+    fields = {}
 
-    console.print("\n[bold]Define parameters[/bold] (press Enter with empty name to finish)")
+    console.print(f"\n[bold]Define {label}s[/bold] (press Enter with empty name to finish)")
 
     while True:
-        param_name = Prompt.ask("Parameter name", default="")
-        if not param_name:
+        field_name = Prompt.ask(f"{label.capitalize()} name", default="")
+        if not field_name:
             break
 
-        # Parameter type
-        console.print("  Type options: " + ", ".join(f"[{i+1}]{t}" for i, t in enumerate(TYPE_OPTIONS)))
+        # Field type, by number or by name
+        console.print(_TYPE_OPTIONS_PROMPT)
         type_choice = Prompt.ask("  Type", default="1")
-        try:
-            param_type = TYPE_OPTIONS[int(type_choice) - 1]
-        except (ValueError, IndexError):
-            param_type = type_choice if type_choice in TYPE_OPTIONS else "string"
+        field_type = _TYPE_BY_INDEX.get(type_choice) or (
+            type_choice if type_choice in TYPE_OPTIONS else "string"
+        )
 
         # Description
-        param_desc = Prompt.ask("  Description", default=f"The {param_name} parameter")
+        field_desc = Prompt.ask("  Description", default=f"The {field_name} {label}")
+
+        fields[field_name] = {
+            "type": field_type,
+            "description": field_desc,
+        }
 
         # Required?
-        is_required = Confirm.ask("  Required?", default=False)
+        if ask_required:
+            fields[field_name]["required"] = Confirm.ask("  Required?", default=False)
 
-        parameters[param_name] = {
-            "type": param_type,
-            "description": param_desc,
-            "required": is_required,
-        }
+        console.print(f"  [green]✓ Added {label} '{field_name}'[/green]")
 
-        console.print(f"  [green]✓ Added parameter '{param_name}'[/green]")
+    return fields
 
-    return parameters
+
+def prompt_for_parameters() -> dict:
+    """Interactive prompt for tool/view parameters."""
+    return _prompt_fields("parameter", ask_required=True)
 
 
 @app.command("tool")
@@ -106,6 +97,7 @@ def add_tool(
         a4e add tool calculate_bmi -d "Calculate BMI"
         a4e add tool  # Interactive mode
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -113,6 +105,8 @@ def add_tool(
 
     # Interactive prompts
     if not non_interactive:
+        from rich.prompt import Prompt
+
         if not tool_name:
             tool_name = Prompt.ask("[bold]Tool name[/bold] (snake_case)")
 
@@ -134,8 +128,8 @@ def add_tool(
         parameters = json.loads(parameters_json) if parameters_json else {}
 
     # Validate tool name
-    if not tool_name.replace("_", "").isalnum():
-        console.print("[red]Error: Tool name must be alphanumeric with underscores[/red]")
+    if not is_valid_tool_name(tool_name):
+        console.print("[red]Error: Tool name must be a valid Python identifier and not a keyword[/red]")
         raise typer.Exit(code=1)
 
     try:
@@ -163,7 +157,7 @@ def add_tool(
 
 @app.command("view")
 def add_view(
-    view_id: Optional[str] = typer.Argument(None, help="View ID (lowercase, hyphens)"),
+    view_id: Optional[str] = typer.Argument(None, help="View ID (snake_case)"),
     description: Optional[str] = typer.Option(
         None, "--description", "-d", help="View description"
     ),
@@ -181,9 +175,10 @@ def add_view(
     Add a new React view to the agent.
 
     Example:
-        a4e add view results-display -d "Display search results"
+        a4e add view results_display -d "Display search results"
         a4e add view  # Interactive mode
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -191,35 +186,16 @@ def add_view(
 
     # Interactive prompts
     if not non_interactive:
+        from rich.prompt import Prompt
+
         if not view_id:
-            view_id = Prompt.ask("[bold]View ID[/bold] (lowercase, hyphens)")
+            view_id = Prompt.ask("[bold]View ID[/bold] (snake_case)")
 
         if not description:
-            description = Prompt.ask("[bold]Description[/bold]", default=f"A view for {view_id.replace('-', ' ')}")
+            description = Prompt.ask("[bold]Description[/bold]", default=f"A view for {view_id.replace('_', ' ')}")
 
         if not props_json:
-            console.print("\n[bold]Define props[/bold] (press Enter with empty name to finish)")
-            props = {}
-
-            while True:
-                prop_name = Prompt.ask("Prop name", default="")
-                if not prop_name:
-                    break
-
-                console.print("  Type options: " + ", ".join(f"[{i+1}]{t}" for i, t in enumerate(TYPE_OPTIONS)))
-                type_choice = Prompt.ask("  Type", default="1")
-                try:
-                    prop_type = TYPE_OPTIONS[int(type_choice) - 1]
-                except (ValueError, IndexError):
-                    prop_type = type_choice if type_choice in TYPE_OPTIONS else "string"
-
-                prop_desc = Prompt.ask("  Description", default=f"The {prop_name} prop")
-
-                props[prop_name] = {
-                    "type": prop_type,
-                    "description": prop_desc,
-                }
-                console.print(f"  [green]✓ Added prop '{prop_name}'[/green]")
+            props = _prompt_fields("prop", ask_required=False)
         else:
             try:
                 props = json.loads(props_json)
@@ -232,6 +208,11 @@ def add_view(
             raise typer.Exit(code=1)
         props = json.loads(props_json) if props_json else {}
 
+    # Validate view ID
+    if not _VIEW_ID_RE.match(view_id):
+        console.print("[red]Error: View ID must be snake_case (lowercase letters, digits, underscores; starting with a letter)[/red]")
+        raise typer.Exit(code=1)
+
     try:
         from ..tools.views.add_view import add_view as mcp_add_view
 
@@ -287,9 +268,10 @@ def add_skill(
     Add a new skill to the agent.
 
     Example:
-        a4e add skill show_results --name "Show Results" --view results-display
+        a4e add skill show_results --name "Show Results" --view results_display
         a4e add skill  # Interactive mode
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -297,6 +279,8 @@ def add_skill(
 
     # Interactive prompts
     if not non_interactive:
+        from rich.prompt import Prompt, Confirm
+
         if not skill_id:
             skill_id = Prompt.ask("[bold]Skill ID[/bold] (snake_case)")
 
@@ -310,14 +294,13 @@ def add_skill(
         if not intent_triggers:
             console.print("\n[bold]Enter intent triggers[/bold] (comma-separated phrases)")
             triggers_input = Prompt.ask("Triggers", default=skill_id.replace("_", " "))
-            intent_triggers_list = [t.strip() for t in triggers_input.split(",") if t.strip()]
+            intent_triggers_list = split_csv(triggers_input)
         else:
-            intent_triggers_list = [t.strip() for t in intent_triggers.split(",")]
+            intent_triggers_list = split_csv(intent_triggers)
 
         if not output_view:
             # List available views
-            views_dir = agent_dir / "views"
-            available_views = [d.name for d in views_dir.iterdir() if d.is_dir()] if views_dir.exists() else []
+            available_views = list_subdirs(agent_dir, "views")
 
             if available_views:
                 console.print("\n[bold]Available views:[/bold]")
@@ -328,8 +311,7 @@ def add_skill(
 
         if not internal_tools:
             # List available tools
-            tools_dir = agent_dir / "tools"
-            available_tools = [f.stem for f in tools_dir.glob("*.py") if f.stem != "__init__" and f.stem != "schemas"] if tools_dir.exists() else []
+            available_tools = list_tool_names(agent_dir / "tools", exclude=("__init__", "schemas"))
 
             if available_tools:
                 console.print("\n[bold]Available tools:[/bold]")
@@ -337,17 +319,17 @@ def add_skill(
                     console.print(f"  • {t}")
 
             tools_input = Prompt.ask("[bold]Internal tools[/bold] (comma-separated, or empty)", default="")
-            internal_tools_list = [t.strip() for t in tools_input.split(",") if t.strip()]
+            internal_tools_list = split_csv(tools_input)
         else:
-            internal_tools_list = [t.strip() for t in internal_tools.split(",") if t.strip()]
+            internal_tools_list = split_csv(internal_tools)
 
         requires_auth = Confirm.ask("Requires authentication?", default=False)
     else:
         if not all([skill_id, name, description, output_view]):
             console.print("[red]Error: --yes requires skill_id, --name, --description, and --view[/red]")
             raise typer.Exit(code=1)
-        intent_triggers_list = [t.strip() for t in (intent_triggers or "").split(",")] if intent_triggers else []
-        internal_tools_list = [t.strip() for t in (internal_tools or "").split(",")] if internal_tools else []
+        intent_triggers_list = split_csv(intent_triggers)
+        internal_tools_list = split_csv(internal_tools)
 
     try:
         from ..tools.skills.add_skill import add_skill as mcp_add_skill
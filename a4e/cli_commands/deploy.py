@@ -4,15 +4,13 @@ Command for deploying an agent to production.
 """
 
 import typer
-from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-console = Console()
+from .helpers import (
+    find_agent_dir,
+    get_console,
+    load_validation_cache,
+)
 
 # Create a 'Typer' app for the 'deploy' command
 app = typer.Typer(
@@ -21,26 +19,6 @@ app = typer.Typer(
 )
 
 
-def find_agent_dir(agent_name: Optional[str] = None) -> Optional[Path]:
-    """Find the agent directory from name or current working directory."""
-    cwd = Path.cwd()
-
-    if agent_name:
-        if Path(agent_name).is_absolute() and Path(agent_name).exists():
-            return Path(agent_name)
-        if (cwd / agent_name).exists():
-            return cwd / agent_name
-        agent_store = cwd / "file-store" / "agent-store" / agent_name
-        if agent_store.exists():
-            return agent_store
-        return None
-
-    if (cwd / "agent.py").exists() and (cwd / "metadata.json").exists():
-        return cwd
-
-    return None
-
-
 @app.callback(invoke_without_command=True)
 def deploy(
     ctx: typer.Context,
@@ -66,6 +44,9 @@ def deploy(
         a4e deploy
         a4e deploy --agent my-agent --yes
     """
+    from rich.panel import Panel
+
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -76,34 +57,54 @@ def deploy(
         border_style="blue"
     ))
 
-    # Run validation first (unless skipped)
+    # Run validation first (unless skipped). A pass here, fresh or cached,
+    # is handed to the deploy tool so it doesn't validate the tree again.
+    validated = False
     if not skip_validation:
         console.print("\n[bold]Step 1: Validation[/bold]")
-        try:
-            from ..tools.validation.validate import validate as mcp_validate
 
-            result = mcp_validate(agent_name=str(agent_dir))
-
-            errors = result.get("errors", [])
-            warnings = result.get("warnings", [])
-
-            if errors:
-                console.print(f"[red]  ✗ Validation failed with {len(errors)} error(s)[/red]")
-                for error in errors:
-                    console.print(f"    [red]•[/red] {error}")
-                console.print("\n[yellow]Fix errors before deploying, or use --skip-validation to bypass.[/yellow]")
-                raise typer.Exit(code=1)
-            elif warnings:
-                console.print(f"[green]  ✓ Validation passed with {len(warnings)} warning(s)[/green]")
+        # Reuse a fresh result from a recent 'a4e validate' (only it writes the cache)
+        cached = load_validation_cache(agent_dir)
+        if cached is not None:
+            warnings = cached.get("warnings", [])
+            if warnings:
+                console.print(f"[green]  ✓ Validation passed with {len(warnings)} warning(s) (cached)[/green]")
             else:
-                console.print("[green]  ✓ Validation passed[/green]")
-
-        except ImportError as e:
-            console.print(f"[red]Error importing validation: {e}[/red]")
-            raise typer.Exit(code=1)
+                console.print("[green]  ✓ Validation passed (cached)[/green]")
+            validated = True
+        else:
+            try:
+                from ..tools.validation.validate import validate as mcp_validate
+
+                result = mcp_validate(agent_name=str(agent_dir))
+
+                # validate() reports failures as success=False plus "details"
+                # (or a single "error" for missing files)
+                errors = [] if result.get("success") else (
+                    result.get("details") or [result.get("error", "Validation failed")]
+                )
+                warnings = result.get("warnings", [])
+
+                if errors:
+                    console.print(f"[red]  ✗ Validation failed with {len(errors)} error(s)[/red]")
+                    for error in errors:
+                        console.print(f"    [red]•[/red] {error}")
+                    console.print("\n[yellow]Fix errors before deploying, or use --skip-validation to bypass.[/yellow]")
+                    raise typer.Exit(code=1)
+                elif warnings:
+                    console.print(f"[green]  ✓ Validation passed with {len(warnings)} warning(s)[/green]")
+                else:
+                    console.print("[green]  ✓ Validation passed[/green]")
+                validated = True
+
+            except ImportError as e:
+                console.print(f"[red]Error importing validation: {e}[/red]")
+                raise typer.Exit(code=1)
 
     # Confirm deployment
     if not yes:
+        from rich.prompt import Confirm
+
         console.print("")
         if not Confirm.ask("Proceed with deployment?", default=True):
             console.print("[yellow]Deployment cancelled.[/yellow]")
@@ -113,6 +114,7 @@ def deploy(
     console.print("\n[bold]Step 2: Deployment[/bold]")
 
     try:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         from ..tools.deploy.deploy import deploy as mcp_deploy
 
         with Progress(
@@ -122,7 +124,7 @@ def deploy(
         ) as progress:
             task = progress.add_task("Deploying to A4E Hub...", total=None)
 
-            result = mcp_deploy(agent_name=str(agent_dir))
+            result = mcp_deploy(agent_name=str(agent_dir), skip_validation=validated)
 
             progress.update(task, completed=True)
 
@@ -1,13 +1,12 @@
 # a4e/cli_commands/dev.py
 
 import typer
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-import pyperclip
+from typing import Optional, Tuple
 import os
-
-
-from ..utils.dev_manager import DevManager  # Correct relative import
+import re
+import sys
 
 
 # Create a 'Typer' app specifically for the 'dev' command group
@@ -17,6 +16,37 @@ app = typer.Typer(
 )
 
 
+# Matches an uncommented top-level or indented "authtoken:" entry in ngrok.yml
+_AUTHTOKEN_RE = re.compile(rb"(?m)^[ \t]*authtoken:[ \t]*['\"]?([^'\"\s#]+)")
+
+
+@lru_cache(maxsize=1)
+def _ngrok_config_candidates() -> Tuple[Path, ...]:
+    """Known ngrok config locations, in lookup order."""
+    home = Path.home()
+    return (
+        home / "AppData" / "Local" / "ngrok" / "ngrok.yml",  # Windows
+        home / ".ngrok2" / "ngrok.yml",  # Linux
+        home / ".config" / "ngrok" / "ngrok.yml",  # Linux
+        home / "Library" / "Application Support" / "ngrok" / "ngrok.yml",  # macOS
+    )
+
+
+@lru_cache(maxsize=1)
+def _read_config_authtoken() -> Optional[str]:
+    """Scan the known ngrok config locations for an authtoken."""
+    for config_path in _ngrok_config_candidates():
+        # One unreadable or missing config must not stop the scan
+        try:
+            data = config_path.read_bytes()
+        except OSError:
+            continue
+        match = _AUTHTOKEN_RE.search(data)
+        if match:
+            return match.group(1).decode()
+    return None
+
+
 def get_ngrok_authtoken():
     """
     Attempts to retrieve the ngrok authtoken from the system.
@@ -28,23 +58,10 @@ def get_ngrok_authtoken():
 
     # If not an environment variable try to look for it in the system
     try:
-        home = Path.home()
-        config_paths = [
-            home / "AppData" / "Local" / "ngrok" / "ngrok.yml",  # Windows
-            home / ".ngrok2" / "ngrok.yml",  # Linux
-            home / ".config" / "ngrok" / "ngrok.yml",  # Linux
-            home / "Library" / "Application Support" / "ngrok" / "ngrok.yml",  # macOS
-        ]
-        for config_path in config_paths:
-            if config_path.exists():
-                with open(config_path, "r") as f:
-                    for line in f:
-                        if line.strip().startswith("authtoken:"):
-                            return line.strip().split(":", 1)[1].strip().strip("'\"")
-    except Exception:
-        pass
-
-    return None
+        return _read_config_authtoken()
+    except RuntimeError:
+        # Path.home() could not determine the home directory
+        return None
 
 
 @app.command()
@@ -83,31 +100,34 @@ def start(
     elif current_dir.name == "agent-store":
         # We're in agent-store - list available agents and prompt for selection
         agent_store_path = current_dir
-        available_agents = []
-        if agent_store_path.is_dir():
-            available_agents = [d for d in agent_store_path.iterdir() if d.is_dir()]
+        # Let scandir report a missing store instead of probing it first;
+        # DirEntry.is_dir() reuses the d_type from scandir instead of a stat per entry
+        try:
+            with os.scandir(agent_store_path) as entries:
+                available_agents = [Path(e.path) for e in entries if e.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            available_agents = []
+        available_agents.sort(key=lambda p: p.name)  # deterministic menu order
 
-        while not project_dir:
+        if not available_agents:
             print("\nSelect an agent to start:")
-            if available_agents:
-                for i, agent in enumerate(available_agents):
-                    print(f"  [{i + 1}] {agent.name}")
-                prompt_text = "\nPlease choose an agent"
-            else:
-                print("No agents found in the current 'agent-store' directory.")
-                raise typer.Exit(code=1)
-
-            try:
-                # Check if user entered a number
-                response = typer.prompt(prompt_text, type=str)
-                choice_index = int(response) - 1
-                if 0 <= choice_index < len(available_agents):
-                    project_dir = available_agents[choice_index]
-                else:
-                    print("Invalid number. Please try again.")
-            except ValueError:
-                # User entered a path string
-                print("Please enter a valid number.")
+            print("No agents found in the current 'agent-store' directory.")
+            raise typer.Exit(code=1)
+
+        # Build the menu once and write it in a single call
+        menu_text = "\nSelect an agent to start:\n" + "\n".join(
+            f"  [{i + 1}] {agent.name}" for i, agent in enumerate(available_agents)
+        )
+        sys.stdout.write(menu_text + "\n")
+        sys.stdout.flush()
+
+        # typer.prompt re-asks on non-numbers; EOF/Ctrl-C exit as "Aborted."
+        while True:
+            choice = typer.prompt("\nPlease choose an agent", type=int)
+            if 1 <= choice <= len(available_agents):
+                break
+            print("Invalid number. Please try again.")
+        project_dir = available_agents[choice - 1]
     else:
         print("Error: Run this command from an agent directory or the 'agent-store' directory.")
         print(f"Current directory: {current_dir}")
@@ -122,6 +142,8 @@ def start(
     print(f"\nUsing agent folder: {project_dir}")
     print("Starting development server...")
 
+    from ..utils.dev_manager import DevManager
+
     result = DevManager.start_dev_server(
         project_dir=project_dir, port=port, auth_token=auth_token
     )
@@ -132,8 +154,12 @@ def start(
         print(f"  Hub URL: {result.get('hub_url')}")
 
         try:
+            import pyperclip
+
             pyperclip.copy(str(result.get("hub_url")))
             print("  (Hub URL copied to clipboard!)")
+        except ImportError:
+            print("  (Could not copy Hub URL to clipboard: pyperclip is not installed.)")
         except pyperclip.PyperclipException:
             print(
                 "  (Could not copy Hub URL to clipboard. Please install xclip/xsel or enable Wayland clipboard for Linux.)"
@@ -0,0 +1,171 @@
+# a4e/cli_commands/helpers.py
+"""
+Shared helpers for CLI commands.
+
+This module must stay free of rich/typer imports so loading it is nearly free.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from ..utils.json_io import dump_json
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Return the shared rich Console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def split_csv(value: Optional[str]) -> List[str]:
+    """Split a comma-separated option into stripped, non-empty items."""
+    return list(filter(None, map(str.strip, (value or "").split(","))))
+
+
+def list_subdirs(parent: Path, child: str) -> List[str]:
+    """Names of the directories inside parent/child; empty if it can't be read."""
+    try:
+        with os.scandir(os.path.join(parent, child)) as entries:
+            return [e.name for e in entries if e.is_dir()]
+    except OSError:
+        return []
+
+
+def write_json(data) -> None:
+    """Write data to stdout as indented JSON, using orjson when it is installed."""
+    sys.stdout.write(dump_json(data, indent=True).decode("utf-8") + "\n")
+
+
+def _exists(path: str) -> bool:
+    """Cheap existence check: a single stat() without Path normalization."""
+    try:
+        os.stat(path)
+    except OSError:
+        return False
+    return True
+
+
+_AGENT_MARKERS = frozenset(("agent.py", "metadata.json"))
+
+
+@lru_cache(maxsize=32)
+def _find_agent_dir(cwd: str, agent_name: Optional[str]) -> Optional[Path]:
+    if agent_name:
+        # Absolute path: one stat decides, the other candidates resolve to it too
+        if os.path.isabs(agent_name):
+            return Path(agent_name) if _exists(agent_name) else None
+        # Check relative to cwd, then in the agent-store
+        for candidate in (
+            os.path.join(cwd, agent_name),
+            os.path.join(cwd, "file-store", "agent-store", agent_name),
+        ):
+            if _exists(candidate):
+                return Path(candidate)
+        return None
+
+    # Check if cwd is an agent directory (has agent.py and metadata.json),
+    # using one directory read instead of a stat per marker file
+    found = set()
+    try:
+        with os.scandir(cwd) as entries:
+            for entry in entries:
+                if entry.name in _AGENT_MARKERS:
+                    found.add(entry.name)
+                    if len(found) == len(_AGENT_MARKERS):
+                        return Path(cwd)
+    except OSError:
+        pass
+
+    return None
+
+
+def find_agent_dir(agent_name: Optional[str] = None) -> Optional[Path]:
+    """Find the agent directory from name or current working directory."""
+    return _find_agent_dir(os.getcwd(), agent_name)
+
+
+# Successful validation results are reused for this long if the tree is unchanged
+VALIDATION_CACHE_TTL = 60.0
+_VALIDATION_CACHE = os.path.join(".a4e", "validation.cache.json")
+
+
+def _tree_fingerprint(agent_dir: Path) -> str:
+    """Hash of (relative path, mtime, size) for every file under the agent dir."""
+    digest = hashlib.blake2b(digest_size=8)
+    root = str(agent_dir)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith(".") and entry.name != "__pycache__":
+                    stack.append(entry.path)
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            rel = os.path.relpath(entry.path, root)
+            digest.update(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def load_validation_cache(agent_dir: Path) -> Optional[dict]:
+    """Return a cached successful validation result if it is fresh, else None."""
+    try:
+        with open(os.path.join(agent_dir, _VALIDATION_CACHE), "rb") as f:
+            cached = json.load(f)
+        if time.time() - cached["ts"] >= VALIDATION_CACHE_TTL:
+            return None
+        if cached["sig"] != _tree_fingerprint(agent_dir):
+            return None
+        return cached["result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_json_atomic(path: str, data) -> bool:
+    """Write data as JSON via a temp file + os.replace; return False on failure."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
+def save_validation_cache(agent_dir: Path, result: dict) -> None:
+    """Record a successful validation result; failures to write are ignored."""
+    write_json_atomic(
+        os.path.join(agent_dir, _VALIDATION_CACHE),
+        {"sig": _tree_fingerprint(agent_dir), "ts": time.time(), "result": result},
+    )
+
+
+def user_cache_dir() -> str:
+    """Per-user cache directory for the CLI ($XDG_CACHE_HOME/a4e or ~/.cache/a4e)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "a4e")
@@ -5,14 +5,40 @@ Command for displaying agent information.
 
 import typer
 import json
-from pathlib import Path
+import os
 from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from .helpers import (
+    find_agent_dir,
+    get_console,
+    user_cache_dir,
+    write_json,
+    write_json_atomic,
+)
+
+# Source of the instructions payload; its stat keys the on-disk cache
+_INSTRUCTIONS_SOURCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tools", "project", "get_instructions.py",
+)
 
-console = Console()
+# Body of the "Agent Info" panel
+_INFO_PANEL_TMPL = (
+    "[bold cyan]{display_name}[/bold cyan]\n"
+    "[dim]{description}[/dim]\n\n"
+    "[bold]ID:[/bold] {id}\n"
+    "[bold]Category:[/bold] {category}\n"
+    "[bold]Path:[/bold] {path}"
+)
+
+# Rows of the structure summary and naming conventions tables
+_STRUCTURE_COUNTS = (
+    ("Tools", "tools_count"),
+    ("Views", "views_count"),
+    ("Skills", "skills_count"),
+    ("Prompts", "prompts_count"),
+)
+_NAMING_KEYS = ("agent_name", "tool_name", "view_id", "skill_id")
 
 # Create a 'Typer' app for the 'info' command
 app = typer.Typer(
@@ -21,26 +47,6 @@ app = typer.Typer(
 )
 
 
-def find_agent_dir(agent_name: Optional[str] = None) -> Optional[Path]:
-    """Find the agent directory from name or current working directory."""
-    cwd = Path.cwd()
-
-    if agent_name:
-        if Path(agent_name).is_absolute() and Path(agent_name).exists():
-            return Path(agent_name)
-        if (cwd / agent_name).exists():
-            return cwd / agent_name
-        agent_store = cwd / "file-store" / "agent-store" / agent_name
-        if agent_store.exists():
-            return agent_store
-        return None
-
-    if (cwd / "agent.py").exists() and (cwd / "metadata.json").exists():
-        return cwd
-
-    return None
-
-
 @app.callback(invoke_without_command=True)
 def info(
     ctx: typer.Context,
@@ -66,7 +72,7 @@ def info(
 
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
-        console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
+        get_console().print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
         raise typer.Exit(code=1)
 
     try:
@@ -77,18 +83,26 @@ def info(
         # Handle response (get_agent_info returns {"agent_id", "metadata", "path"} or {"error"})
         if "error" not in result:
             if json_output:
-                console.print(json.dumps(result, indent=2))
+                # Plain write: rich would scan for markup and wrap long lines
+                write_json(result)
                 return
 
+            from rich.panel import Panel
+            from rich.table import Table
+
+            console = get_console()
+
             # Display panel with basic info
             metadata = result.get("metadata", {})
 
             console.print(Panel.fit(
-                f"[bold cyan]{metadata.get('display_name', agent_dir.name)}[/bold cyan]\n"
-                f"[dim]{metadata.get('description', 'No description')}[/dim]\n\n"
-                f"[bold]ID:[/bold] {metadata.get('id', agent_dir.name)}\n"
-                f"[bold]Category:[/bold] {metadata.get('category', 'Unknown')}\n"
-                f"[bold]Path:[/bold] {agent_dir}",
+                _INFO_PANEL_TMPL.format(
+                    display_name=metadata.get("display_name", agent_dir.name),
+                    description=metadata.get("description", "No description"),
+                    id=metadata.get("id", agent_dir.name),
+                    category=metadata.get("category", "Unknown"),
+                    path=agent_dir,
+                ),
                 title="Agent Info",
                 border_style="blue"
             ))
@@ -100,42 +114,59 @@ def info(
             table.add_column("Component", style="cyan")
             table.add_column("Count", justify="right")
 
-            table.add_row("Tools", str(structure.get("tools_count", 0)))
-            table.add_row("Views", str(structure.get("views_count", 0)))
-            table.add_row("Skills", str(structure.get("skills_count", 0)))
-            table.add_row("Prompts", str(structure.get("prompts_count", 0)))
-
-            console.print("")
-            console.print(table)
+            for label, key in _STRUCTURE_COUNTS:
+                table.add_row(label, str(structure.get(key, 0)))
 
-            # List items if present
-            if structure.get("tools"):
-                console.print("\n[bold]Tools:[/bold]")
-                for tool in structure.get("tools", []):
-                    console.print(f"  • {tool}")
+            console.print(table, new_line_start=True)
 
-            if structure.get("views"):
-                console.print("\n[bold]Views:[/bold]")
-                for view in structure.get("views", []):
-                    console.print(f"  • {view}")
-
-            if structure.get("skills"):
-                console.print("\n[bold]Skills:[/bold]")
-                for skill in structure.get("skills", []):
-                    console.print(f"  • {skill}")
+            # List items if present, one print per section
+            for key, title in (("tools", "Tools"), ("views", "Views"), ("skills", "Skills")):
+                items = structure.get(key)
+                if items:
+                    console.print(f"\n[bold]{title}:[/bold]\n" + "\n".join(f"  • {item}" for item in items))
 
         else:
-            console.print(f"[red]Error: {result.get('error')}[/red]")
+            get_console().print(f"[red]Error: {result.get('error')}[/red]")
             raise typer.Exit(code=1)
 
     except ImportError as e:
-        console.print(f"[red]Error importing tools: {e}[/red]")
+        get_console().print(f"[red]Error importing tools: {e}[/red]")
         raise typer.Exit(code=1)
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        get_console().print(f"[red]Error: {e}[/red]")
         raise typer.Exit(code=1)
 
 
+def _load_instructions() -> dict:
+    """
+    Return the get_instructions() payload, cached on disk.
+
+    The payload is static text, so it is keyed on the mtime and size of its
+    source file; a hit avoids importing the whole MCP tools package.
+    """
+    try:
+        st = os.stat(_INSTRUCTIONS_SOURCE)
+        cache_file = os.path.join(
+            user_cache_dir(), f"instructions-{st.st_mtime_ns:x}-{st.st_size:x}.json"
+        )
+    except OSError:
+        cache_file = None
+
+    if cache_file:
+        try:
+            with open(cache_file, "rb") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    from ..tools.project.get_instructions import get_instructions as mcp_get_instructions
+
+    result = mcp_get_instructions()
+    if cache_file and result.get("success"):
+        write_json_atomic(cache_file, result)
+    return result
+
+
 @app.command("instructions")
 def instructions(
     json_output: bool = typer.Option(
@@ -153,15 +184,19 @@ def instructions(
         a4e info instructions --json
     """
     try:
-        from ..tools.project.get_instructions import get_instructions as mcp_get_instructions
-
-        result = mcp_get_instructions()
+        result = _load_instructions()
 
         if result.get("success"):
             if json_output:
-                console.print(json.dumps(result, indent=2))
+                # Plain write: rich would scan for markup and wrap long lines
+                write_json(result)
                 return
 
+            from rich.panel import Panel
+            from rich.table import Table
+
+            console = get_console()
+
             # Display the instructions with nice formatting
             console.print(Panel.fit(
                 "[bold cyan]A4E Agent Creator - AI Instructions[/bold cyan]\n\n"
@@ -182,25 +217,22 @@ def instructions(
             table.add_row("Templates", ", ".join(quick_ref.get("templates", [])))
 
             naming = quick_ref.get("naming", {})
-            table.add_row("agent_name", naming.get("agent_name", ""))
-            table.add_row("tool_name", naming.get("tool_name", ""))
-            table.add_row("view_id", naming.get("view_id", ""))
-            table.add_row("skill_id", naming.get("skill_id", ""))
+            for key in _NAMING_KEYS:
+                table.add_row(key, naming.get(key, ""))
 
-            console.print("")
-            console.print(table)
+            console.print(table, new_line_start=True)
 
             # Print the full instructions
             console.print("\n[bold]Full Instructions:[/bold]\n")
             console.print(result.get("instructions", ""))
 
         else:
-            console.print(f"[red]Error: {result.get('error')}[/red]")
+            get_console().print(f"[red]Error: {result.get('error')}[/red]")
             raise typer.Exit(code=1)
 
     except ImportError as e:
-        console.print(f"[red]Error importing tools: {e}[/red]")
+        get_console().print(f"[red]Error importing tools: {e}[/red]")
         raise typer.Exit(code=1)
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        get_console().print(f"[red]Error: {e}[/red]")
         raise typer.Exit(code=1)
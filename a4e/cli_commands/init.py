@@ -4,14 +4,11 @@ Interactive project initialization command.
 """
 
 import typer
+import re
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-
-console = Console()
+from .helpers import get_console
 
 # Create a 'Typer' app for the 'init' command
 app = typer.Typer(
@@ -38,10 +35,29 @@ TEMPLATES = {
     "full": "Basic + example tool + example view",
 }
 
+# Lookup structures derived once from the tables above
+_CATEGORY_SET = frozenset(CATEGORIES)
+_CATEGORY_JOIN = ", ".join(CATEGORIES)
+_TEMPLATE_KEYS = tuple(TEMPLATES)
+_TEMPLATE_JOIN = ", ".join(TEMPLATES)
+
+
+# Lowercase letters, digits, hyphens and underscores, with at least one letter
+_AGENT_NAME_RE = re.compile(r"\A(?=[0-9_-]*[a-z])[a-z0-9_-]+\Z")
+
 
 def validate_agent_name(name: str) -> bool:
     """Validate agent name format (lowercase, hyphens/underscores only)."""
-    return name.replace("-", "").replace("_", "").isalnum() and name.islower()
+    return _AGENT_NAME_RE.match(name) is not None
+
+
+def _pick(count: int, default: int) -> int:
+    """Read a 1-based menu number from stdin and return it as a 0-based index."""
+    while True:
+        choice = input(f"Enter number ({default}): ").strip() or str(default)
+        if choice.isdecimal() and 1 <= int(choice) <= count:
+            return int(choice) - 1
+        get_console().print("[red]Invalid selection. Please enter a number.[/red]")
 
 
 @app.callback(invoke_without_command=True)
@@ -74,6 +90,9 @@ def init(
 
     Run without arguments for an interactive wizard, or pass all options for non-interactive mode.
     """
+    from rich.panel import Panel
+
+    console = get_console()
     console.print(Panel.fit(
         "[bold blue]A4E Agent Creator[/bold blue]\n"
         "Create a new conversational AI agent",
@@ -82,6 +101,8 @@ def init(
 
     # Interactive mode - prompt for missing values
     if not non_interactive:
+        from rich.prompt import Prompt
+
         # Agent name
         if not name:
             while True:
@@ -114,16 +135,7 @@ def init(
             for i, cat in enumerate(CATEGORIES, 1):
                 console.print(f"  [{i}] {cat}")
 
-            while True:
-                choice = Prompt.ask("Enter number", default="9")
-                try:
-                    idx = int(choice) - 1
-                    if 0 <= idx < len(CATEGORIES):
-                        category = CATEGORIES[idx]
-                        break
-                except ValueError:
-                    pass
-                console.print("[red]Invalid selection. Please enter a number.[/red]")
+            category = CATEGORIES[_pick(len(CATEGORIES), default=len(CATEGORIES))]
 
         # Template selection
         if not template:
@@ -131,16 +143,7 @@ def init(
             for i, (key, desc) in enumerate(TEMPLATES.items(), 1):
                 console.print(f"  [{i}] {key}: {desc}")
 
-            while True:
-                choice = Prompt.ask("Enter number", default="1")
-                try:
-                    idx = int(choice) - 1
-                    if 0 <= idx < len(TEMPLATES):
-                        template = list(TEMPLATES.keys())[idx]
-                        break
-                except ValueError:
-                    pass
-                console.print("[red]Invalid selection. Please enter a number.[/red]")
+            template = _TEMPLATE_KEYS[_pick(len(_TEMPLATE_KEYS), default=1)]
 
     # Validate all required fields
     if not all([name, display_name, description, category, template]):
@@ -151,12 +154,12 @@ def init(
         console.print("[red]Error: Agent name must be lowercase with hyphens/underscores only.[/red]")
         raise typer.Exit(code=1)
 
-    if category not in CATEGORIES:
-        console.print(f"[red]Error: Invalid category. Choose from: {', '.join(CATEGORIES)}[/red]")
+    if category not in _CATEGORY_SET:
+        console.print(f"[red]Error: Invalid category. Choose from: {_CATEGORY_JOIN}[/red]")
         raise typer.Exit(code=1)
 
     if template not in TEMPLATES:
-        console.print(f"[red]Error: Invalid template. Choose from: {', '.join(TEMPLATES.keys())}[/red]")
+        console.print(f"[red]Error: Invalid template. Choose from: {_TEMPLATE_JOIN}[/red]")
         raise typer.Exit(code=1)
 
     # Confirmation
@@ -168,18 +171,21 @@ def init(
         console.print(f"  Category: {category}")
         console.print(f"  Template: {template}")
 
+        from rich.prompt import Confirm
+
         if not Confirm.ask("\nProceed?", default=True):
             console.print("[yellow]Cancelled.[/yellow]")
             raise typer.Exit(code=0)
 
     # Import and call the MCP tool function directly
     try:
+        from ..core import set_project_dir
         from ..tools.project.initialize_project import initialize_project
 
-        # Set environment variable for directory if specified
-        import os
+        # Point the tools at the target directory without touching os.environ
         if directory:
-            os.environ["A4E_WORKSPACE"] = str(Path(directory).resolve())
+            workspace = Path(directory)
+            set_project_dir(workspace if workspace.is_absolute() else workspace.resolve())
 
         result = initialize_project(
             name=name,
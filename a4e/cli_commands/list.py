@@ -3,14 +3,18 @@
 Commands for listing tools, views, and skills in an agent.
 """
 
+import sys
 import typer
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
-from rich.console import Console
-from rich.table import Table
+from .helpers import find_agent_dir, get_console
+
+
+def _write_rows(rows: Iterable[Tuple[str, ...]]) -> None:
+    """Write tab-separated rows in one call (plain output for pipes and scripts)."""
+    sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
 
-console = Console()
 
 # Create a 'Typer' app for the 'list' command group
 app = typer.Typer(
@@ -19,26 +23,6 @@ app = typer.Typer(
 )
 
 
-def find_agent_dir(agent_name: Optional[str] = None) -> Optional[Path]:
-    """Find the agent directory from name or current working directory."""
-    cwd = Path.cwd()
-
-    if agent_name:
-        if Path(agent_name).is_absolute() and Path(agent_name).exists():
-            return Path(agent_name)
-        if (cwd / agent_name).exists():
-            return cwd / agent_name
-        agent_store = cwd / "file-store" / "agent-store" / agent_name
-        if agent_store.exists():
-            return agent_store
-        return None
-
-    if (cwd / "agent.py").exists() and (cwd / "metadata.json").exists():
-        return cwd
-
-    return None
-
-
 @app.command("tools")
 def list_tools(
     agent_name: Optional[str] = typer.Option(
@@ -57,9 +41,15 @@ def list_tools(
     """
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
-        console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
+        get_console().print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
         raise typer.Exit(code=1)
 
+    _show_tools(agent_dir, verbose)
+
+
+def _show_tools(agent_dir: Path, verbose: bool = False) -> None:
+    """Print the tools of an already-resolved agent directory."""
+    console = get_console()
     try:
         from ..tools.agent_tools.list_tools import list_tools as mcp_list_tools
 
@@ -70,9 +60,17 @@ def list_tools(
             tools = result.get("tools", [])
 
             if not tools:
-                console.print("[yellow]No tools found.[/yellow]")
+                # Piped output stays pure TSV: no rows, no message
+                if sys.stdout.isatty():
+                    console.print("[yellow]No tools found.[/yellow]")
+                return
+
+            if not sys.stdout.isatty():
+                _write_rows((tool, f"tools/{tool}.py") for tool in tools)
                 return
 
+            from rich.table import Table
+
             table = Table(title=f"Tools ({len(tools)})")
             table.add_column("Name", style="cyan")
             table.add_column("File", style="dim")
@@ -109,9 +107,15 @@ def list_views(
     """
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
-        console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
+        get_console().print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
         raise typer.Exit(code=1)
 
+    _show_views(agent_dir, verbose)
+
+
+def _show_views(agent_dir: Path, verbose: bool = False) -> None:
+    """Print the views of an already-resolved agent directory."""
+    console = get_console()
     try:
         from ..tools.views.list_views import list_views as mcp_list_views
 
@@ -122,9 +126,17 @@ def list_views(
             views = result.get("views", [])
 
             if not views:
-                console.print("[yellow]No views found.[/yellow]")
+                # Piped output stays pure TSV: no rows, no message
+                if sys.stdout.isatty():
+                    console.print("[yellow]No views found.[/yellow]")
+                return
+
+            if not sys.stdout.isatty():
+                _write_rows((view, f"views/{view}/view.tsx") for view in views)
                 return
 
+            from rich.table import Table
+
             table = Table(title=f"Views ({len(views)})")
             table.add_column("ID", style="cyan")
             table.add_column("Path", style="dim")
@@ -161,9 +173,15 @@ def list_skills(
     """
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
-        console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
+        get_console().print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
         raise typer.Exit(code=1)
 
+    _show_skills(agent_dir, verbose)
+
+
+def _show_skills(agent_dir: Path, verbose: bool = False) -> None:
+    """Print the skills of an already-resolved agent directory."""
+    console = get_console()
     try:
         from ..tools.skills.list_skills import list_skills as mcp_list_skills
 
@@ -174,9 +192,28 @@ def list_skills(
             skills = result.get("skills", [])
 
             if not skills:
-                console.print("[yellow]No skills found.[/yellow]")
+                # Piped output stays pure TSV: no rows, no message
+                if sys.stdout.isatty():
+                    console.print("[yellow]No skills found.[/yellow]")
                 return
 
+            if not sys.stdout.isatty():
+                if verbose:
+                    _write_rows(
+                        (
+                            skill.get("id", ""),
+                            skill.get("name", ""),
+                            skill.get("output_view", ""),
+                            ",".join(skill.get("intent_triggers", [])),
+                        )
+                        for skill in skills
+                    )
+                else:
+                    _write_rows((skill.get("id", ""), skill.get("name", "")) for skill in skills)
+                return
+
+            from rich.table import Table
+
             table = Table(title=f"Skills ({len(skills)})")
             table.add_column("ID", style="cyan")
             table.add_column("Name", style="green")
@@ -217,11 +254,24 @@ def list_all(
     """
     List all tools, views, and skills in the agent.
     """
-    console.print("[bold]Tools:[/bold]")
-    list_tools(agent_name=agent_name, verbose=False)
+    console = get_console()
+    # Resolve the agent once and reuse it for all three listings
+    agent_dir = find_agent_dir(agent_name)
+    if not agent_dir:
+        console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
+        raise typer.Exit(code=1)
+
+    # Section headers are for humans; piped output is the bare TSV rows
+    tty = sys.stdout.isatty()
+
+    if tty:
+        console.print("[bold]Tools:[/bold]")
+    _show_tools(agent_dir)
 
-    console.print("\n[bold]Views:[/bold]")
-    list_views(agent_name=agent_name, verbose=False)
+    if tty:
+        console.print("\n[bold]Views:[/bold]")
+    _show_views(agent_dir)
 
-    console.print("\n[bold]Skills:[/bold]")
-    list_skills(agent_name=agent_name, verbose=False)
+    if tty:
+        console.print("\n[bold]Skills:[/bold]")
+    _show_skills(agent_dir)
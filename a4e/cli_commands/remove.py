@@ -4,13 +4,9 @@ Commands for removing tools, views, and skills from an agent.
 """
 
 import typer
-from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-from rich.prompt import Confirm
-
-console = Console()
+from .helpers import find_agent_dir, get_console
 
 # Create a 'Typer' app for the 'remove' command group
 app = typer.Typer(
@@ -18,25 +14,9 @@ app = typer.Typer(
     help="Remove tools, views, or skills from your agent.",
 )
 
-
-def find_agent_dir(agent_name: Optional[str] = None) -> Optional[Path]:
-    """Find the agent directory from name or current working directory."""
-    cwd = Path.cwd()
-
-    if agent_name:
-        if Path(agent_name).is_absolute() and Path(agent_name).exists():
-            return Path(agent_name)
-        if (cwd / agent_name).exists():
-            return cwd / agent_name
-        agent_store = cwd / "file-store" / "agent-store" / agent_name
-        if agent_store.exists():
-            return agent_store
-        return None
-
-    if (cwd / "agent.py").exists() and (cwd / "metadata.json").exists():
-        return cwd
-
-    return None
+# Built-in views and skills every agent needs; these can't be removed
+_PROTECTED_VIEWS = frozenset({"welcome"})
+_PROTECTED_SKILLS = frozenset({"show_welcome"})
 
 
 @app.command("tool")
@@ -56,6 +36,7 @@ def remove_tool(
         a4e remove tool calculate_bmi
         a4e remove tool calculate_bmi --yes
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -63,6 +44,8 @@ def remove_tool(
 
     # Confirm removal
     if not yes:
+        from rich.prompt import Confirm
+
         if not Confirm.ask(f"Remove tool '{tool_name}'?", default=False):
             console.print("[yellow]Cancelled.[/yellow]")
             raise typer.Exit(code=0)
@@ -103,21 +86,24 @@ def remove_view(
     Note: The 'welcome' view cannot be removed as it's required.
 
     Example:
-        a4e remove view results-display
-        a4e remove view results-display --yes
+        a4e remove view results_display
+        a4e remove view results_display --yes
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
         raise typer.Exit(code=1)
 
-    # Warn about welcome view
-    if view_id == "welcome":
-        console.print("[red]Error: Cannot remove the 'welcome' view - it is required for all agents.[/red]")
+    # Refuse to remove built-in views
+    if view_id in _PROTECTED_VIEWS:
+        console.print(f"[red]Error: Cannot remove the '{view_id}' view - it is required for all agents.[/red]")
         raise typer.Exit(code=1)
 
     # Confirm removal
     if not yes:
+        from rich.prompt import Confirm
+
         if not Confirm.ask(f"Remove view '{view_id}'?", default=False):
             console.print("[yellow]Cancelled.[/yellow]")
             raise typer.Exit(code=0)
@@ -161,18 +147,21 @@ def remove_skill(
         a4e remove skill show_results
         a4e remove skill show_results --yes
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
         raise typer.Exit(code=1)
 
-    # Warn about show_welcome skill
-    if skill_id == "show_welcome":
-        console.print("[red]Error: Cannot remove the 'show_welcome' skill - it is required for all agents.[/red]")
+    # Refuse to remove built-in skills
+    if skill_id in _PROTECTED_SKILLS:
+        console.print(f"[red]Error: Cannot remove the '{skill_id}' skill - it is required for all agents.[/red]")
         raise typer.Exit(code=1)
 
     # Confirm removal
     if not yes:
+        from rich.prompt import Confirm
+
         if not Confirm.ask(f"Remove skill '{skill_id}'?", default=False):
             console.print("[yellow]Cancelled.[/yellow]")
             raise typer.Exit(code=0)
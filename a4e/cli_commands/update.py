@@ -4,14 +4,17 @@ Commands for updating tools, views, and skills in an agent.
 """
 
 import typer
-import json
-from pathlib import Path
+import sys
 from typing import Optional
 
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-
-console = Console()
+from ..core import list_tool_names
+from ..utils.json_io import parse_json
+from .helpers import (
+    find_agent_dir,
+    get_console,
+    list_subdirs,
+    split_csv,
+)
 
 # Create a 'Typer' app for the 'update' command group
 app = typer.Typer(
@@ -22,24 +25,11 @@ app = typer.Typer(
 TYPE_OPTIONS = ["string", "number", "integer", "boolean", "array", "object"]
 
 
-def find_agent_dir(agent_name: Optional[str] = None) -> Optional[Path]:
-    """Find the agent directory from name or current working directory."""
-    cwd = Path.cwd()
-
-    if agent_name:
-        if Path(agent_name).is_absolute() and Path(agent_name).exists():
-            return Path(agent_name)
-        if (cwd / agent_name).exists():
-            return cwd / agent_name
-        agent_store = cwd / "file-store" / "agent-store" / agent_name
-        if agent_store.exists():
-            return agent_store
-        return None
-
-    if (cwd / "agent.py").exists() and (cwd / "metadata.json").exists():
-        return cwd
-
-    return None
+def _require_tty(console, message: str) -> None:
+    """Exit with message instead of prompting when stdin is not a terminal."""
+    if not sys.stdin.isatty():
+        console.print(f"[red]Error: {message}[/red]")
+        raise typer.Exit(code=1)
 
 
 @app.command("tool")
@@ -62,6 +52,7 @@ def update_tool(
         a4e update tool calculate_bmi -d "New description"
         a4e update tool calculate_bmi -p '{"weight": "number", "height": "number"}'
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -71,17 +62,21 @@ def update_tool(
     if not tool_name:
         tools_dir = agent_dir / "tools"
         if tools_dir.exists():
-            available = [f.stem for f in tools_dir.glob("*.py") if f.stem != "__init__"]
+            _require_tty(console, "No tool specified and stdin is not a TTY. Pass the tool name as an argument.")
+            from rich.prompt import Prompt
+
+            available = list_tool_names(tools_dir)
             if available:
-                console.print("[bold]Available tools:[/bold]")
-                for t in available:
-                    console.print(f"  • {t}")
+                console.print("[bold]Available tools:[/bold]\n" + "\n".join(f"  • {t}" for t in available))
             tool_name = Prompt.ask("[bold]Tool to update[/bold]")
         else:
             console.print("[red]No tools directory found[/red]")
             raise typer.Exit(code=1)
 
     if not description and not parameters_json:
+        _require_tty(console, "Nothing to update and stdin is not a TTY. Pass --description or --parameters.")
+        from rich.prompt import Prompt, Confirm
+
         console.print("[yellow]What would you like to update?[/yellow]")
         update_desc = Confirm.ask("Update description?", default=False)
         if update_desc:
@@ -95,8 +90,8 @@ def update_tool(
     parameters = None
     if parameters_json:
         try:
-            parameters = json.loads(parameters_json)
-        except json.JSONDecodeError:
+            parameters = parse_json(parameters_json)
+        except ValueError:
             console.print("[red]Invalid JSON for parameters[/red]")
             raise typer.Exit(code=1)
 
@@ -144,6 +139,7 @@ def update_view(
         a4e update view dashboard -d "New description"
         a4e update view dashboard -p '{"title": "string", "items": "array"}'
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -153,17 +149,21 @@ def update_view(
     if not view_id:
         views_dir = agent_dir / "views"
         if views_dir.exists():
-            available = [d.name for d in views_dir.iterdir() if d.is_dir() and not d.name.startswith("_")]
+            _require_tty(console, "No view specified and stdin is not a TTY. Pass the view ID as an argument.")
+            from rich.prompt import Prompt
+
+            available = [v for v in list_subdirs(agent_dir, "views") if not v.startswith("_")]
             if available:
-                console.print("[bold]Available views:[/bold]")
-                for v in available:
-                    console.print(f"  • {v}")
+                console.print("[bold]Available views:[/bold]\n" + "\n".join(f"  • {v}" for v in available))
             view_id = Prompt.ask("[bold]View to update[/bold]")
         else:
             console.print("[red]No views directory found[/red]")
             raise typer.Exit(code=1)
 
     if not description and not props_json:
+        _require_tty(console, "Nothing to update and stdin is not a TTY. Pass --description or --props.")
+        from rich.prompt import Prompt, Confirm
+
         console.print("[yellow]What would you like to update?[/yellow]")
         update_desc = Confirm.ask("Update description?", default=False)
         if update_desc:
@@ -176,8 +176,8 @@ def update_view(
     props = None
     if props_json:
         try:
-            props = json.loads(props_json)
-        except json.JSONDecodeError:
+            props = parse_json(props_json)
+        except ValueError:
             console.print("[red]Invalid JSON for props[/red]")
             raise typer.Exit(code=1)
 
@@ -224,8 +224,9 @@ def update_skill(
     Update an existing skill's properties.
 
     Example:
-        a4e update skill show_results --name "Display Results" --view new-results
+        a4e update skill show_results --name "Display Results" --view new_results
     """
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -233,26 +234,28 @@ def update_skill(
 
     # List available skills if none specified
     if not skill_id:
-        skills_file = agent_dir / "skills" / "schemas.json"
-        if skills_file.exists():
-            try:
-                schemas = json.loads(skills_file.read_text())
-                available = list(schemas.keys())
-                if available:
-                    console.print("[bold]Available skills:[/bold]")
-                    for s in available:
-                        console.print(f"  • {s}")
-                skill_id = Prompt.ask("[bold]Skill to update[/bold]")
-            except json.JSONDecodeError:
-                console.print("[red]Could not parse skills/schemas.json[/red]")
-                raise typer.Exit(code=1)
-        else:
+        # Read directly instead of checking exists() first: one open, not stat + open
+        try:
+            raw = (agent_dir / "skills" / "schemas.json").read_bytes()
+        except OSError:
             console.print("[red]No skills/schemas.json found[/red]")
             raise typer.Exit(code=1)
+        try:
+            available = list(parse_json(raw))
+        except ValueError:
+            console.print("[red]Could not parse skills/schemas.json[/red]")
+            raise typer.Exit(code=1)
+
+        _require_tty(console, "No skill specified and stdin is not a TTY. Pass the skill ID as an argument.")
+        from rich.prompt import Prompt
+
+        if available:
+            console.print("[bold]Available skills:[/bold]\n" + "\n".join(f"  • {s}" for s in available))
+        skill_id = Prompt.ask("[bold]Skill to update[/bold]")
 
     # Parse list options
-    triggers_list = [t.strip() for t in intent_triggers.split(",")] if intent_triggers else None
-    tools_list = [t.strip() for t in internal_tools.split(",") if t.strip()] if internal_tools else None
+    triggers_list = split_csv(intent_triggers) if intent_triggers else None
+    tools_list = split_csv(internal_tools) if internal_tools else None
 
     try:
         from ..tools.skills.update_skill import update_skill as mcp_update_skill
@@ -272,8 +275,7 @@ def update_skill(
             console.print(f"\n[green]✓ Skill '{skill_id}' updated![/green]")
             console.print(f"  Path: {result.get('path')}")
             if result.get("warnings"):
-                for w in result["warnings"]:
-                    console.print(f"  [yellow]Warning: {w}[/yellow]")
+                console.print("\n".join(f"  [yellow]Warning: {w}[/yellow]" for w in result["warnings"]))
         else:
             console.print(f"\n[red]Error: {result.get('error')}[/red]")
             if result.get("fix"):
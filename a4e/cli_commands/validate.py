@@ -4,14 +4,9 @@ Command for validating an agent project.
 """
 
 import typer
-from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-
-console = Console()
+from .helpers import find_agent_dir, get_console, save_validation_cache
 
 # Create a 'Typer' app for the 'validate' command
 app = typer.Typer(
@@ -20,26 +15,6 @@ app = typer.Typer(
 )
 
 
-def find_agent_dir(agent_name: Optional[str] = None) -> Optional[Path]:
-    """Find the agent directory from name or current working directory."""
-    cwd = Path.cwd()
-
-    if agent_name:
-        if Path(agent_name).is_absolute() and Path(agent_name).exists():
-            return Path(agent_name)
-        if (cwd / agent_name).exists():
-            return cwd / agent_name
-        agent_store = cwd / "file-store" / "agent-store" / agent_name
-        if agent_store.exists():
-            return agent_store
-        return None
-
-    if (cwd / "agent.py").exists() and (cwd / "metadata.json").exists():
-        return cwd
-
-    return None
-
-
 @app.callback(invoke_without_command=True)
 def validate(
     ctx: typer.Context,
@@ -64,6 +39,9 @@ def validate(
         a4e validate
         a4e validate --agent my-agent --strict
     """
+    from rich.panel import Panel
+
+    console = get_console()
     agent_dir = find_agent_dir(agent_name)
     if not agent_dir:
         console.print("[red]Error: Not in an agent directory. Use --agent to specify the agent.[/red]")
@@ -80,20 +58,25 @@ def validate(
         result = mcp_validate(agent_name=str(agent_dir))
 
         if result.get("success"):
+            # Let a follow-up 'a4e deploy' reuse this result
+            save_validation_cache(agent_dir, result)
+
             errors = result.get("errors", [])
             warnings = result.get("warnings", [])
 
             # Show errors
             if errors:
-                console.print(f"\n[red bold]Errors ({len(errors)}):[/red bold]")
-                for error in errors:
-                    console.print(f"  [red]✗[/red] {error}")
+                console.print(
+                    f"\n[red bold]Errors ({len(errors)}):[/red bold]\n"
+                    + "\n".join(f"  [red]✗[/red] {error}" for error in errors)
+                )
 
             # Show warnings
             if warnings:
-                console.print(f"\n[yellow bold]Warnings ({len(warnings)}):[/yellow bold]")
-                for warning in warnings:
-                    console.print(f"  [yellow]⚠[/yellow] {warning}")
+                console.print(
+                    f"\n[yellow bold]Warnings ({len(warnings)}):[/yellow bold]\n"
+                    + "\n".join(f"  [yellow]⚠[/yellow] {warning}" for warning in warnings)
+                )
 
             # Summary
             console.print("")
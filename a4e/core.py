@@ -2,31 +2,81 @@
 Core module with shared utilities and MCP instance.
 """
 
-from mcp.server.fastmcp import FastMCP
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
+import keyword
 import os
 import re
-from jinja2 import Environment, FileSystemLoader
+import string
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+    from mcp.server.fastmcp import FastMCP
 
 # Global project directory (set by CLI args)
 _PROJECT_DIR: Optional[Path] = None
 
-# Initialize MCP server
-mcp = FastMCP(name="a4e-agent-creator")
+# MCP server and template environment, built on first use (see __getattr__)
+_mcp: Optional["FastMCP"] = None
+_jinja_env: Optional["Environment"] = None
+
+# get_project_dir results, keyed on everything the resolution depends on
+_PROJECT_DIR_CACHE: dict = {}
+
+
+def get_mcp() -> "FastMCP":
+    """Return the shared MCP server instance, creating it on first use."""
+    global _mcp
+    if _mcp is None:
+        from mcp.server.fastmcp import FastMCP
+
+        _mcp = FastMCP(name="a4e-agent-creator")
+    return _mcp
+
+
+def get_jinja_env() -> "Environment":
+    """Return the shared Jinja environment for code templates, creating it on first use."""
+    global _jinja_env
+    if _jinja_env is None:
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+        # Compiled templates are kept across runs so a cold start loads them
+        # instead of re-parsing. The default directory is a private per-user
+        # temp dir; entries are keyed on the template source checksum.
+        try:
+            bytecode_cache = FileSystemBytecodeCache(pattern="__a4e_%s.cache")
+        except (OSError, RuntimeError):
+            # No usable temp dir: fall back to compiling in memory
+            bytecode_cache = None
+
+        template_dir = Path(__file__).parent / "templates"
+        _jinja_env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=False,  # Explicit for code generation
+            # Templates ship with the package: compile each once per process and
+            # skip the mtime check get_template would otherwise do on every call
+            auto_reload=False,
+            bytecode_cache=bytecode_cache,
+        )
+    return _jinja_env
+
 
-# Load templates
-template_dir = Path(__file__).parent / "templates"
-jinja_env = Environment(
-    loader=FileSystemLoader(template_dir),
-    autoescape=False,  # Explicit for code generation
-)
+def __getattr__(name: str):
+    # Keep `from .core import mcp` / `jinja_env` working without paying for
+    # FastMCP and jinja2 on every import of this module
+    if name == "mcp":
+        return get_mcp()
+    if name == "jinja_env":
+        return get_jinja_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def set_project_dir(path: Path) -> None:
     """Set the global project directory."""
     global _PROJECT_DIR
     _PROJECT_DIR = path
+    _PROJECT_DIR_CACHE.clear()
 
 
 def get_configured_project_dir() -> Optional[Path]:
@@ -34,7 +84,23 @@ def get_configured_project_dir() -> Optional[Path]:
     return _PROJECT_DIR
 
 
-def sanitize_input(value: str, allowed_chars: str = r"a-zA-Z0-9_-") -> str:
+_SANITIZE_DEFAULT = r"a-zA-Z0-9_-"
+
+# str.translate table equivalent to _SANITIZE_DEFAULT for ASCII input:
+# allowed characters map to themselves, everything else is dropped
+_SANITIZE_DEFAULT_TABLE = {
+    cp: (chr(cp) if chr(cp) in string.ascii_letters + string.digits + "_-" else None)
+    for cp in range(128)
+}
+
+
+@lru_cache(maxsize=16)
+def _sanitize_pattern(allowed_chars: str) -> "re.Pattern[str]":
+    """Compiled pattern matching every character outside allowed_chars."""
+    return re.compile(f"[^{allowed_chars}]")
+
+
+def sanitize_input(value: str, allowed_chars: str = _SANITIZE_DEFAULT) -> str:
     """
     Sanitize user input to prevent template injection.
 
@@ -45,8 +111,14 @@ def sanitize_input(value: str, allowed_chars: str = r"a-zA-Z0-9_-") -> str:
     Returns:
         Sanitized string with only allowed characters
     """
-    pattern = f"[^{allowed_chars}]"
-    return re.sub(pattern, "", value)
+    if allowed_chars == _SANITIZE_DEFAULT and value.isascii():
+        return value.translate(_SANITIZE_DEFAULT_TABLE)
+    return _sanitize_pattern(allowed_chars).sub("", value)
+
+
+def is_valid_tool_name(name: str) -> bool:
+    """Tool names become a module and a function: a non-keyword Python identifier."""
+    return name.isidentifier() and not keyword.iskeyword(name)
 
 
 def get_project_dir(agent_name: Optional[str] = None) -> Path:
@@ -67,23 +139,35 @@ def get_project_dir(agent_name: Optional[str] = None) -> Path:
     Raises:
         ValueError: If agent creation attempted in invalid location
     """
-    global _PROJECT_DIR
-
+    workspace = os.environ.get("A4E_WORKSPACE")
+    # The cwd only matters when neither override is set
+    cwd = None if (_PROJECT_DIR or workspace) else os.getcwd()
+    key = (_PROJECT_DIR, workspace, cwd, agent_name)
+    cached = _PROJECT_DIR_CACHE.get(key)
+    if cached is None:
+        cached = _PROJECT_DIR_CACHE[key] = _resolve_project_dir(workspace, cwd, agent_name)
+    return cached
+
+
+def _resolve_project_dir(
+    workspace: Optional[str], cwd: Optional[str], agent_name: Optional[str]
+) -> Path:
+    """Uncached body of get_project_dir."""
     # Priority 1: Explicit CLI override
     if _PROJECT_DIR:
         root = _PROJECT_DIR
     # Priority 2: Workspace from editor (portable solution)
-    elif os.environ.get("A4E_WORKSPACE"):
-        root = Path(os.environ["A4E_WORKSPACE"]).resolve()
+    elif workspace:
+        root = Path(workspace).resolve()
     # Priority 3: Fallback to cwd
     else:
-        root = Path.cwd()
+        root = Path(cwd)
 
     if not agent_name:
         return root
 
     # Agents live in file-store/agent-store
-    agent_store = root / "file-store" / "agent-store"
+    agent_store = root.joinpath("file-store", "agent-store")
 
     # Safety: Prevent creating in user HOME without agent-store
     if root == Path.home() and not agent_store.exists():
@@ -95,3 +179,24 @@ def get_project_dir(agent_name: Optional[str] = None) -> Path:
 
     return agent_store / agent_name
 
+
+def list_tool_names(tools_dir: Path, exclude: Iterable[str] = ("__init__",)) -> List[str]:
+    """
+    Names of the tool modules (.py files other than those in exclude) in tools_dir.
+
+    Uses one scandir pass, so file types come from the directory entries
+    instead of a stat per file. Returns an empty list if the directory
+    can't be read.
+    """
+    skip = {f"{name}.py" for name in exclude}
+    names = []
+    try:
+        with os.scandir(tools_dir) as entries:
+            # Filter on the entry name before touching the filesystem again
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".py") and name not in skip and entry.is_file():
+                    names.append(name[:-3])
+    except OSError:
+        return []
+    return names
@@ -1,13 +1,24 @@
 import sys
 import os
+import hashlib
 import importlib.util
-import inspect
+import io
 import json
+import re
 import argparse
 from pathlib import Path
-from types import ModuleType
+from types import FunctionType, ModuleType
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is the fallback
+    orjson = None
+
+
+# Extra request logging for debugging the dev server itself
+_VERBOSE = bool(os.environ.get("A4E_DEV_VERBOSE"))
+
 
 # Mock a4e SDK and autogen
 def _mock_dependencies():
@@ -26,6 +37,8 @@ def _mock_dependencies():
         # Mock tool decorator
         def tool(func):
             func._is_tool = True
+            # Record it on the defining module so loading needn't scan every attribute
+            func.__globals__.setdefault("__a4e_tools__", []).append(func)
             return func
 
         sdk.tool = tool
@@ -47,44 +60,271 @@ def _mock_dependencies():
         sys.modules["autogen_agentchat.agents"] = agents
 
 
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _load_json(path: Path, default: Any) -> Any:
+    """Parse a JSON file; default if it doesn't exist."""
+    try:
+        return _loads(path.read_bytes())
+    except FileNotFoundError:
+        return default
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data the way starlette's JSONResponse does, via orjson when installed."""
+    if orjson is None:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(data)
+
+
+def _tools_payload(tools_schemas: list) -> list:
+    """Convert tool schemas to the format the frontend expects."""
+    tools = []
+    for schema in tools_schemas:
+        params = []
+        if "inputSchema" in schema and "properties" in schema["inputSchema"]:
+            required = schema["inputSchema"].get("required", [])
+            for param_name, param_info in schema["inputSchema"]["properties"].items():
+                params.append(
+                    {
+                        "name": param_name,
+                        "type": param_info.get("type", "string"),
+                        "description": param_info.get("description", ""),
+                        "required": param_name in required,
+                    }
+                )
+        tools.append(
+            {
+                "name": schema.get("name", ""),
+                "description": schema.get("description", ""),
+                "parameters": params,
+            }
+        )
+    return tools
+
+
+def _views_payload(views_schemas: dict) -> list:
+    """Convert view schemas to the format the frontend expects."""
+    views = []
+    for view_id, view_data in views_schemas.items():
+        props = []
+        if "params" in view_data:
+            for prop_name, prop_info in view_data["params"].items():
+                props.append(
+                    {
+                        "name": prop_name,
+                        "type": prop_info.get("type", "string"),
+                        "required": True,  # Default to required
+                        "description": prop_info.get("description", ""),
+                    }
+                )
+        views.append(
+            {
+                "id": view_data.get("id", view_id),
+                "description": view_data.get("description", ""),
+                "props": props,
+            }
+        )
+    return views
+
+
+def _skills_payload(skills_schemas: dict) -> list:
+    """Convert skill schemas to the format the frontend expects."""
+    return [
+        {
+            "id": skill_data.get("id", skill_id),
+            "name": skill_data.get("name", skill_id),
+            "description": skill_data.get("description", ""),
+            "intent_triggers": skill_data.get("intent_triggers", []),
+            "requires_auth": skill_data.get("requires_auth", False),
+            "internal_tools": skill_data.get("internal_tools", []),
+            "output": skill_data.get("output", {}),
+        }
+        for skill_id, skill_data in skills_schemas.items()
+    ]
+
+
+def _iter_source_files(root: str):
+    """Yield DirEntry objects for the files under root, top-down like os.walk.
+
+    Hidden files are skipped and __pycache__ is pruned without being read.
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, don't descend into symlinked directories
+                    if entry.name != "__pycache__" and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.is_file() and not entry.name.startswith("."):
+                    yield entry
+    except OSError:
+        return
+    for path in subdirs:
+        yield from _iter_source_files(path)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable stream that hands written bytes back on drain().
+
+    zipfile writes to it with data descriptors, so an archive can be sent while
+    it is still being built.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        chunks, self._chunks = self._chunks, []
+        return b"".join(chunks)
+
+
+# zlib level for /download: source text compresses nearly as well at 3 as at
+# the default 6, for noticeably less CPU
+_ZIP_COMPRESSLEVEL = 3
+
+# Entries that DEFLATE can't usefully shrink are stored as-is in /download
+_STORED_MIN_SIZE = 256
+_STORED_EXTENSIONS = frozenset(
+    (".png", ".jpg", ".jpeg", ".gif", ".webp", ".woff", ".woff2", ".zip", ".gz")
+)
+
+
+def _zip_compression(name: str, size: int) -> int:
+    """ZIP_STORED for tiny or already-compressed files, ZIP_DEFLATED otherwise."""
+    import zipfile
+
+    if size < _STORED_MIN_SIZE or os.path.splitext(name)[1].lower() in _STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+# Demo views the dev chat can switch to, in priority order, with their props
+_VIEW_SWITCH_PROPS = {
+    "profile": {
+        "userName": "Test User",
+        "email": "test@example.com",
+        "role": "Developer"
+    },
+    "results": {
+        "title": "Analysis Complete",
+        "summary": "Here are your test results",
+        "items": [
+            {"title": "Test 1", "description": "First test passed", "value": "100%", "status": "success"},
+            {"title": "Test 2", "description": "Minor issues found", "value": "85%", "status": "warning"},
+            {"title": "Test 3", "description": "Needs attention", "value": "60%", "status": "error"}
+        ]
+    },
+    "error": {
+        "title": "Test Error",
+        "message": "This is a test error message to demonstrate the error view.",
+        "errorCode": "TEST_001",
+        "suggestion": "This is just a demo - no action needed!"
+    },
+    "welcome": {
+        "title": "Welcome Back!",
+        "subtitle": "Ready to help you",
+        "userName": "Developer"
+    },
+}
+
+# "show <view>" or "<view> view", found in a single scan of the message
+_VIEW_SWITCH_RE = re.compile(
+    r"show ({0})|({0}) view".format("|".join(_VIEW_SWITCH_PROPS)), re.IGNORECASE
+)
+
+
+def _stream_batch_size() -> int:
+    """Words per streamed chat event, from A4E_STREAM_BATCH (default 4)."""
+    try:
+        return max(1, int(os.environ.get("A4E_STREAM_BATCH", "4")))
+    except ValueError:
+        return 4
+
+
+_STREAM_BATCH = _stream_batch_size()
+
+# SSE payloads that never change, serialized once
+_STATUS_FRAME = json.dumps({"type": "status", "content": "Processing request..."})
+_CHAT_COMPLETE_FRAME = json.dumps({"type": "chat", "content": "", "complete": True})
+_DONE_FRAME = json.dumps({"type": "done", "content": "Stream complete"})
+_VIEW_SWITCH_FRAMES = {
+    view_id: json.dumps({"type": "view", "viewId": view_id, "props": props})
+    for view_id, props in _VIEW_SWITCH_PROPS.items()
+}
+
+
+def _chat_frame(content: str) -> str:
+    """Streamed chat chunk; same text json.dumps gives for the full dict."""
+    return '{"type": "chat", "content": ' + json.dumps(content) + ', "complete": false}'
+
+
+def _match_view_switch(message: str) -> Optional[str]:
+    """Return the demo view a chat message asks for, if any."""
+    found = {(m.group(1) or m.group(2)).lower() for m in _VIEW_SWITCH_RE.finditer(message)}
+    for view_id in _VIEW_SWITCH_PROPS:
+        if view_id in found:
+            return view_id
+    return None
+
+
+def _module_tools(module: ModuleType, stem: str) -> list:
+    """Functions from a loaded tool file to register: @tool ones plus the one named after the file."""
+    namespace = vars(module)
+
+    def own_function(obj) -> bool:
+        return isinstance(obj, FunctionType) and obj.__module__ == module.__name__
+
+    tools = namespace.get("__a4e_tools__")
+    if tools is None:
+        # Not decorated through the mock SDK: scan the module's own functions
+        return [
+            obj
+            for name, obj in sorted(namespace.items())
+            if own_function(obj) and (getattr(obj, "_is_tool", False) or name == stem)
+        ]
+
+    entry = namespace.get(stem)
+    if own_function(entry) and entry not in tools:
+        return [*tools, entry]
+    return list(tools)
+
+
 def run_agent_server(agent_path: Path, port: int):
     """Run the agent in a FastMCP server with REST API endpoints"""
     from mcp.server.fastmcp import FastMCP
     from starlette.applications import Starlette
     from starlette.routing import Route, Mount
-    from starlette.responses import JSONResponse, Response
+    from starlette.responses import JSONResponse, Response, StreamingResponse
     from starlette.middleware.cors import CORSMiddleware
+    from sse_starlette.sse import EventSourceResponse
+    import asyncio
     import zipfile
-    import io
 
     _mock_dependencies()
 
     agent_name = agent_path.name
     mcp = FastMCP(name=agent_name)
 
-    # Load metadata
-    metadata_path = agent_path / "metadata.json"
-    metadata = {}
-    if metadata_path.exists():
-        metadata = json.loads(metadata_path.read_text())
-
-    # Load tools schemas
-    tools_schemas_path = agent_path / "tools" / "schemas.json"
-    tools_schemas = []
-    if tools_schemas_path.exists():
-        tools_schemas = json.loads(tools_schemas_path.read_text())
-
-    # Load views schemas
-    views_schemas_path = agent_path / "views" / "schemas.json"
-    views_schemas = {}
-    if views_schemas_path.exists():
-        views_schemas = json.loads(views_schemas_path.read_text())
-
-    # Load skills schemas
-    skills_schemas_path = agent_path / "skills" / "schemas.json"
-    skills_schemas = {}
-    if skills_schemas_path.exists():
-        skills_schemas = json.loads(skills_schemas_path.read_text())
+    # Load metadata and schemas
+    metadata = _load_json(agent_path / "metadata.json", {})
+    tools_schemas = _load_json(agent_path / "tools" / "schemas.json", [])
+    views_schemas = _load_json(agent_path / "views" / "schemas.json", {})
+    skills_schemas = _load_json(agent_path / "skills" / "schemas.json", {})
 
     # Load system prompt
     prompt_path = agent_path / "prompts" / "agent.md"
@@ -106,15 +346,10 @@ def run_agent_server(agent_path: Path, port: int):
                     module = importlib.util.module_from_spec(spec)
                     spec.loader.exec_module(module)
 
-                    for name, obj in inspect.getmembers(module):
-                        if inspect.isfunction(obj):
-                            if (
-                                getattr(obj, "_is_tool", False)
-                                or name == tool_file.stem
-                            ):
-                                # Register with FastMCP
-                                mcp.tool()(obj)
-                                print(f"Registered tool: {name}")
+                    for obj in _module_tools(module, tool_file.stem):
+                        # Register with FastMCP
+                        mcp.tool()(obj)
+                        print(f"Registered tool: {obj.__name__}")
             except Exception as e:
                 print(f"Failed to load tool {tool_file}: {e}")
 
@@ -124,119 +359,73 @@ def run_agent_server(agent_path: Path, port: int):
         return system_prompt or "You are a helpful assistant."
 
     # REST API Endpoints
-    async def agent_info(request):
-        return JSONResponse(metadata)
-
-    async def get_tools(request):
-        # Convert schema format to frontend expected format
-        tools = []
-        for schema in tools_schemas:
-            params = []
-            if "inputSchema" in schema and "properties" in schema["inputSchema"]:
-                required = schema["inputSchema"].get("required", [])
-                for param_name, param_info in schema["inputSchema"][
-                    "properties"
-                ].items():
-                    params.append(
-                        {
-                            "name": param_name,
-                            "type": param_info.get("type", "string"),
-                            "description": param_info.get("description", ""),
-                            "required": param_name in required,
-                        }
-                    )
-            tools.append(
-                {
-                    "name": schema.get("name", ""),
-                    "description": schema.get("description", ""),
-                    "parameters": params,
-                }
-            )
-        return JSONResponse(tools)
-
-    async def get_views(request):
-        # Convert views schema to frontend expected format
-        views = []
-        for view_id, view_data in views_schemas.items():
-            props = []
-            if "params" in view_data:
-                for prop_name, prop_info in view_data["params"].items():
-                    props.append(
-                        {
-                            "name": prop_name,
-                            "type": prop_info.get("type", "string"),
-                            "required": True,  # Default to required
-                            "description": prop_info.get("description", ""),
-                        }
-                    )
-            views.append(
-                {
-                    "id": view_data.get("id", view_id),
-                    "description": view_data.get("description", ""),
-                    "props": props,
-                }
-            )
-        return JSONResponse(views)
-
-    async def get_skills(request):
-        # Convert skills schema to frontend expected format
-        skills = []
-        for skill_id, skill_data in skills_schemas.items():
-            skills.append(
-                {
-                    "id": skill_data.get("id", skill_id),
-                    "name": skill_data.get("name", skill_id),
-                    "description": skill_data.get("description", ""),
-                    "intent_triggers": skill_data.get("intent_triggers", []),
-                    "requires_auth": skill_data.get("requires_auth", False),
-                    "internal_tools": skill_data.get("internal_tools", []),
-                    "output": skill_data.get("output", {}),
-                }
-            )
-        return JSONResponse(skills)
+    # Schemas and prompt are loaded once, so their responses are serialized once too
+    def static_json(data: Any):
+        body = _dump_json(data)
+        headers = {"ETag": f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'}
+
+        async def endpoint(request):
+            if request.headers.get("if-none-match") == headers["ETag"]:
+                return Response(status_code=304, headers=headers)
+            return Response(body, media_type="application/json", headers=headers)
+
+        return endpoint
+
+    agent_info = static_json(metadata)
+    get_tools = static_json(_tools_payload(tools_schemas))
+    get_views = static_json(_views_payload(views_schemas))
+    get_skills = static_json(_skills_payload(skills_schemas))
+    get_prompt = static_json({"prompt": system_prompt})
+
+    # view_id -> ((mtime_ns, size), view.tsx bytes)
+    view_sources = {}
 
     async def get_view_source(request):
         """Get source code for a specific view"""
         view_id = request.path_params["view_id"]
         view_file = agent_path / "views" / view_id / "view.tsx"
 
-        if not view_file.exists():
+        try:
+            st = os.stat(view_file)
+        except OSError:
             return JSONResponse({"error": "View not found"}, status_code=404)
 
-        return Response(content=view_file.read_text(), media_type="text/plain")
+        # Re-read only when the file has changed since it was last served
+        version = (st.st_mtime_ns, st.st_size)
+        cached = view_sources.get(view_id)
+        if cached is None or cached[0] != version:
+            cached = view_sources[view_id] = (version, view_file.read_bytes())
+
+        return Response(content=cached[1], media_type="text/plain")
+
+    def iter_source_zip():
+        """Yield the agent source as a zip archive, one compressed entry at a time"""
+        sink = _ChunkSink()
+        with zipfile.ZipFile(
+            sink, "w", zipfile.ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL
+        ) as zip_file:
+            for entry in _iter_source_files(str(agent_path)):
+                archive_name = os.path.relpath(entry.path, agent_path)
+                compression = _zip_compression(entry.name, entry.stat().st_size)
+                zip_file.write(entry.path, archive_name, compress_type=compression)
+                yield sink.drain()
+        # Central directory, written when the archive is closed
+        yield sink.drain()
 
     async def download_source(request):
         """Download the entire agent source as a zip file"""
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for root, dirs, files in os.walk(agent_path):
-                for file in files:
-                    # Skip __pycache__ and hidden files
-                    if "__pycache__" in root or file.startswith("."):
-                        continue
-
-                    file_path = os.path.join(root, file)
-                    archive_name = os.path.relpath(file_path, agent_path)
-                    zip_file.write(file_path, archive_name)
-
-        buffer.seek(0)
-        return Response(
-            content=buffer.getvalue(),
+        # A sync iterator runs in starlette's threadpool, so zlib stays off the event loop
+        return StreamingResponse(
+            iter_source_zip(),
             media_type="application/zip",
             headers={"Content-Disposition": f'attachment; filename="{agent_name}.zip"'},
         )
 
-    async def get_prompt(request):
-        return JSONResponse({"prompt": system_prompt})
-
     async def unified_stream(request):
-        from sse_starlette.sse import EventSourceResponse
-        import asyncio
-        import json
-
         try:
-            payload = await request.json()
-            print(f"[DEV] Received payload: {json.dumps(payload, indent=2)}")
+            payload = _loads(await request.body())
+            if _VERBOSE:
+                print(f"[DEV] Received payload: {json.dumps(payload, indent=2)}")
         except Exception as e:
             print(f"[DEV] Error parsing payload: {e}")
             payload = {}
@@ -255,102 +444,37 @@ def run_agent_server(agent_path: Path, port: int):
         print(f"[DEV] Processing message: {last_message}")
 
         # Check for view switch commands
-        message_lower = last_message.lower()
-        view_to_show = None
-        view_props = {}
-
-        if "show profile" in message_lower or "profile view" in message_lower:
-            view_to_show = "profile"
-            view_props = {
-                "userName": "Test User",
-                "email": "test@example.com",
-                "role": "Developer"
-            }
-        elif "show results" in message_lower or "results view" in message_lower:
-            view_to_show = "results"
-            view_props = {
-                "title": "Analysis Complete",
-                "summary": "Here are your test results",
-                "items": [
-                    {"title": "Test 1", "description": "First test passed", "value": "100%", "status": "success"},
-                    {"title": "Test 2", "description": "Minor issues found", "value": "85%", "status": "warning"},
-                    {"title": "Test 3", "description": "Needs attention", "value": "60%", "status": "error"}
-                ]
-            }
-        elif "show error" in message_lower or "error view" in message_lower:
-            view_to_show = "error"
-            view_props = {
-                "title": "Test Error",
-                "message": "This is a test error message to demonstrate the error view.",
-                "errorCode": "TEST_001",
-                "suggestion": "This is just a demo - no action needed!"
-            }
-        elif "show welcome" in message_lower or "welcome view" in message_lower:
-            view_to_show = "welcome"
-            view_props = {
-                "title": "Welcome Back!",
-                "subtitle": "Ready to help you",
-                "userName": "Developer"
-            }
+        view_to_show = _match_view_switch(last_message)
 
         async def event_generator():
             # Simulate thinking delay
             await asyncio.sleep(0.5)
 
             # 1. Send status
-            yield {
-                "data": json.dumps(
-                    {"type": "status", "content": "Processing request..."}
-                )
-            }
+            yield {"data": _STATUS_FRAME}
             await asyncio.sleep(0.5)
 
-            # 2. If view switch requested, send view event
+            # 2. Stream the text response a few words per event
             if view_to_show:
                 response_text = f"Switching to {view_to_show} view..."
-                words = response_text.split(" ")
-                for word in words:
-                    yield {
-                        "data": json.dumps(
-                            {"type": "chat", "content": word + " ", "complete": False}
-                        )
-                    }
-                    await asyncio.sleep(0.05)
-
-                yield {
-                    "data": json.dumps({"type": "chat", "content": "", "complete": True})
-                }
-
-                await asyncio.sleep(0.3)
-
-                # Send view event
-                yield {
-                    "data": json.dumps({
-                        "type": "view",
-                        "viewId": view_to_show,
-                        "props": view_props
-                    })
-                }
             else:
-                # 3. Stream text response
                 response_text = f"I received your message: '{last_message}'. Try saying 'show profile', 'show results', 'show error', or 'show welcome' to switch views!"
 
-                words = response_text.split(" ")
-                for word in words:
-                    yield {
-                        "data": json.dumps(
-                            {"type": "chat", "content": word + " ", "complete": False}
-                        )
-                    }
-                    await asyncio.sleep(0.05)
+            words = response_text.split(" ")
+            for i in range(0, len(words), _STREAM_BATCH):
+                yield {"data": _chat_frame(" ".join(words[i:i + _STREAM_BATCH]) + " ")}
+                await asyncio.sleep(0.05)
+
+            # Complete chat
+            yield {"data": _CHAT_COMPLETE_FRAME}
 
-                # Complete chat
-                yield {
-                    "data": json.dumps({"type": "chat", "content": "", "complete": True})
-                }
+            # 3. If view switch requested, send view event
+            if view_to_show:
+                await asyncio.sleep(0.3)
+                yield {"data": _VIEW_SWITCH_FRAMES[view_to_show]}
 
             # 4. Done signal
-            yield {"data": json.dumps({"type": "done", "content": "Stream complete"})}
+            yield {"data": _DONE_FRAME}
 
             # SSE Done
             yield {"data": "[DONE]"}
@@ -398,17 +522,19 @@ def run_agent_server(agent_path: Path, port: int):
         allow_headers=["*"],
     )
 
-    # Add request logging middleware
-    from starlette.middleware.base import BaseHTTPMiddleware
+    # uvicorn's access log already records each request; the extra wrapper
+    # (and its BaseHTTPMiddleware task per request) is only added when verbose
+    if _VERBOSE:
+        from starlette.middleware.base import BaseHTTPMiddleware
 
-    class LoggingMiddleware(BaseHTTPMiddleware):
-        async def dispatch(self, request, call_next):
-            print(f"[DEV] {request.method} {request.url.path}")
-            response = await call_next(request)
-            print(f"[DEV] Response status: {response.status_code}")
-            return response
+        class LoggingMiddleware(BaseHTTPMiddleware):
+            async def dispatch(self, request, call_next):
+                print(f"[DEV] {request.method} {request.url.path}")
+                response = await call_next(request)
+                print(f"[DEV] Response status: {response.status_code}")
+                return response
 
-    app.add_middleware(LoggingMiddleware)
+        app.add_middleware(LoggingMiddleware)
 
     # Run uvicorn directly with our port
     uvicorn.run(app, host="0.0.0.0", port=port)
@@ -12,29 +12,31 @@ Structure:
 - deploy/       : Deployment (deploy)
 """
 
-# Project tools
-from .project import initialize_project, get_agent_info, get_instructions
-
-# Agent tools management
-from .agent_tools import add_tool, list_tools, remove_tool, update_tool
-
-# Views management
-from .views import add_view, list_views, remove_view, update_view
-
-# Skills management
-from .skills import add_skill, list_skills, remove_skill, update_skill
-
-# Schema generation
-from .schemas import generate_schemas
-
-# Validation
-from .validation import validate
-
-# Development
-from .dev import dev_start, dev_stop, check_environment
-
-# Deployment
-from .deploy import deploy
+# Tool subpackages are imported on first attribute access (PEP 562), so
+# `import a4e.tools` is cheap and only the groups a caller touches get loaded.
+_LAZY = {
+    "initialize_project": ".project",
+    "get_agent_info": ".project",
+    "get_instructions": ".project",
+    "add_tool": ".agent_tools",
+    "list_tools": ".agent_tools",
+    "remove_tool": ".agent_tools",
+    "update_tool": ".agent_tools",
+    "add_view": ".views",
+    "list_views": ".views",
+    "remove_view": ".views",
+    "update_view": ".views",
+    "add_skill": ".skills",
+    "list_skills": ".skills",
+    "remove_skill": ".skills",
+    "update_skill": ".skills",
+    "generate_schemas": ".schemas",
+    "validate": ".validation",
+    "dev_start": ".dev",
+    "dev_stop": ".dev",
+    "check_environment": ".dev",
+    "deploy": ".deploy",
+}
 
 __all__ = [
     # Project
@@ -68,3 +70,12 @@ __all__ = [
     "deploy",
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,14 +2,20 @@
 Add tool tool.
 """
 
+import re
 from typing import Optional
 
-from ...core import mcp, jinja_env, get_project_dir
+from ...core import mcp, get_project_dir, is_valid_tool_name
+from .helpers import get_tool_template, map_tool_parameters
 
 
 @mcp.tool()
 def add_tool(
-    tool_name: str, description: str, parameters: dict, agent_name: Optional[str] = None
+    tool_name: str,
+    description: str,
+    parameters: dict,
+    agent_name: Optional[str] = None,
+    defer_schemas: bool = False,
 ) -> dict:
     """
     Add a new tool with @tool decorator
@@ -19,88 +25,68 @@ def add_tool(
         description: What the tool does
         parameters: Dictionary of parameters with types and descriptions
         agent_name: Optional agent ID if not in agent directory
+        defer_schemas: Skip schema generation; call generate_schemas() once
+            after adding several tools
     """
-    # Validate tool name
-    if not tool_name.replace("_", "").isalnum():
-        suggested = tool_name.replace("-", "_").replace(" ", "_").lower()
-        return {
+    # Validate tool name: it becomes both the module and the function name
+    if not is_valid_tool_name(tool_name):
+        result = {
             "success": False,
-            "error": "Tool name must be alphanumeric with underscores",
-            "fix": f"Try: {suggested}",
+            "error": "Tool name must be a valid Python identifier and not a keyword",
         }
+        suggested = re.sub(r"[^a-z0-9_]", "", tool_name.replace("-", "_").replace(" ", "_").lower())
+        if suggested.strip("_"):
+            if not is_valid_tool_name(suggested):
+                suggested = f"tool_{suggested}"
+            # Only suggest a name that would itself pass the check
+            if is_valid_tool_name(suggested):
+                result["fix"] = f"Try: {suggested}"
+        return result
 
     project_dir = get_project_dir(agent_name)
     tools_dir = project_dir / "tools"
 
-    if not tools_dir.exists():
-        return {
-            "success": False,
-            "error": f"tools/ directory not found at {tools_dir}",
-            "fix": "Initialize an agent first with initialize_project() or specify agent_name",
-        }
-
     tool_file = tools_dir / f"{tool_name}.py"
-    if tool_file.exists():
-        return {
-            "success": False,
-            "error": f"Tool '{tool_name}' already exists",
-            "fix": "Use update_tool() to modify or remove_tool() first",
-        }
 
     try:
-        # Prepare parameters with Python types
-        mapped_params = {}
-        type_mapping = {
-            "string": "str",
-            "number": "float",
-            "integer": "int",
-            "boolean": "bool",
-            "array": "List",
-            "object": "dict",
-        }
-
-        for name, info in parameters.items():
-            # Handle both simple format {'a': 'number'} and detailed format {'a': {'type': 'number', 'description': '...'}}
-            if isinstance(info, str):
-                param_info = {"type": info}
-            else:
-                param_info = info.copy()
-            raw_type = param_info.get("type", "Any")
-
-            # Map JSON type to Python type, or use as-is if not in map (allows direct Python types)
-            py_type = type_mapping.get(raw_type, raw_type)
+        sorted_params = map_tool_parameters(parameters)
 
-            # Handle optional parameters
-            # Check for "required" key (boolean)
-            is_required = param_info.get("required", False)
-
-            if not is_required:
-                py_type = f"Optional[{py_type}] = None"
-
-            param_info["type"] = py_type
-            param_info["is_required"] = is_required
-            mapped_params[name] = param_info
-
-        # Sort parameters: required first, then optional (to avoid SyntaxError)
-        sorted_params = dict(
-            sorted(mapped_params.items(), key=lambda x: (not x[1]["is_required"], x[0]))
-        )
-
-        template = jinja_env.get_template("tool.py.j2")
+        template = get_tool_template()
         code = template.render(
             tool_name=tool_name, description=description, parameters=sorted_params
         )
-        tool_file.write_text(code)
-
-        # Auto-generate schemas after adding tool
-        from ..schemas import generate_schemas
-        generate_schemas(force=False, agent_name=agent_name)
 
-        return {
+        # Exclusive create: the existence checks and the write are one open()
+        try:
+            with open(tool_file, "xb") as f:
+                f.write(code.encode("utf-8"))
+        except FileExistsError:
+            return {
+                "success": False,
+                "error": f"Tool '{tool_name}' already exists",
+                "fix": "Use update_tool() to modify or remove_tool() first",
+            }
+        except FileNotFoundError:
+            return {
+                "success": False,
+                "error": f"tools/ directory not found at {tools_dir}",
+                "fix": "Initialize an agent first with initialize_project() or specify agent_name",
+            }
+
+        result = {
             "success": True,
             "message": f"Created tool '{tool_name}'",
             "path": str(tool_file),
         }
+
+        if defer_schemas:
+            result["next_steps"] = ["Run generate_schemas(force=True) after the last tool change"]
+        else:
+            # Auto-generate schemas after adding tool
+            from ..schemas import generate_schemas
+            generate_schemas(force=False, agent_name=agent_name)
+
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -0,0 +1,69 @@
+"""
+Helper functions for tool management.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from ...core import get_jinja_env
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+# JSON schema type -> Python annotation used in generated tool code
+TYPE_MAPPING = {
+    "string": "str",
+    "number": "float",
+    "integer": "int",
+    "boolean": "bool",
+    "array": "List",
+    "object": "dict",
+}
+
+
+def map_tool_parameters(parameters: dict) -> dict:
+    """
+    Convert a tool's parameters dict into the form tool.py.j2 expects.
+
+    Accepts both the simple format {'a': 'number'} and the detailed format
+    {'a': {'type': 'number', 'description': '...'}}. Types are mapped to
+    Python annotations, optional parameters default to None, and required
+    parameters come first (to avoid a SyntaxError in the generated code).
+
+    Args:
+        parameters: Dictionary of parameters with types and descriptions
+
+    Returns:
+        Ordered dictionary of parameter name -> template info
+    """
+    mapped_params = {}
+    required, optional = [], []
+    for name, info in parameters.items():
+        if isinstance(info, str):
+            param_info = {"type": info}
+        else:
+            param_info = info.copy()
+        raw_type = param_info.get("type", "Any")
+
+        # Map JSON type to Python type, or use as-is if not in map (allows direct Python types)
+        py_type = TYPE_MAPPING.get(raw_type, raw_type)
+
+        is_required = param_info.get("required", False)
+        if not is_required:
+            py_type = f"Optional[{py_type}] = None"
+
+        param_info["type"] = py_type
+        param_info["is_required"] = is_required
+        mapped_params[name] = param_info
+        (required if is_required else optional).append(name)
+
+    # Required first, then optional, each by name; plain string sorts need no key function
+    required.sort()
+    optional.sort()
+    return {name: mapped_params[name] for name in required + optional}
+
+
+@lru_cache(maxsize=1)
+def get_tool_template() -> "Template":
+    """Return the compiled tool.py.j2 template, loaded on first use."""
+    return get_jinja_env().get_template("tool.py.j2")
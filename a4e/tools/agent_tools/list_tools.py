@@ -4,7 +4,7 @@ List tools tool.
 
 from typing import Optional
 
-from ...core import mcp, get_project_dir
+from ...core import mcp, get_project_dir, list_tool_names
 
 
 @mcp.tool()
@@ -15,14 +15,8 @@ def list_tools(agent_name: Optional[str] = None) -> dict:
     project_dir = get_project_dir(agent_name)
     tools_dir = project_dir / "tools"
 
-    if not tools_dir.exists():
-        return {"tools": [], "count": 0}
-
-    tools = []
-    for tool_file in tools_dir.glob("*.py"):
-        if tool_file.name == "__init__.py":
-            continue
-        tools.append(tool_file.stem)
+    # A missing tools/ directory just yields no tools
+    tools = list_tool_names(tools_dir)
 
     return {"tools": sorted(tools), "count": len(tools)}
 
@@ -4,9 +4,10 @@ Remove tool tool.
 
 from pathlib import Path
 from typing import Optional
-import json
+import os
 
-from ...core import mcp, get_project_dir
+from ...core import mcp, get_project_dir, list_tool_names
+from ...utils.json_io import dump_json, parse_json
 
 
 @mcp.tool()
@@ -27,7 +28,7 @@ def remove_tool(
     project_dir = get_project_dir(agent_name)
     tools_dir = project_dir / "tools"
 
-    if not tools_dir.exists():
+    if not os.path.isdir(tools_dir):
         return {
             "success": False,
             "error": f"tools/ directory not found at {tools_dir}",
@@ -36,9 +37,9 @@ def remove_tool(
 
     tool_file = tools_dir / f"{tool_name}.py"
 
-    if not tool_file.exists():
+    if not os.path.exists(tool_file):
         # List available tools for helpful error
-        available = [f.stem for f in tools_dir.glob("*.py") if f.stem != "__init__"]
+        available = list_tool_names(tools_dir)
         return {
             "success": False,
             "error": f"Tool '{tool_name}' not found",
@@ -51,13 +52,13 @@ def remove_tool(
 
         # Update schemas.json if it exists
         schemas_file = tools_dir / "schemas.json"
-        if schemas_file.exists():
+        if os.path.exists(schemas_file):
             try:
-                schemas = json.loads(schemas_file.read_text())
+                schemas = parse_json(schemas_file.read_bytes())
                 if tool_name in schemas:
                     del schemas[tool_name]
-                    schemas_file.write_text(json.dumps(schemas, indent=2))
-            except (json.JSONDecodeError, KeyError):
+                    schemas_file.write_bytes(dump_json(schemas, indent=True))
+            except (ValueError, KeyError):
                 pass  # Ignore schema update errors
 
         return {
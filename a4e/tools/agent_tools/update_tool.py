@@ -3,8 +3,31 @@ Update tool - modify existing tool's description or parameters.
 """
 
 from typing import Optional
+import os
 
-from ...core import mcp, jinja_env, get_project_dir
+from ...core import mcp, get_project_dir, list_tool_names
+from .helpers import get_tool_template, map_tool_parameters
+
+
+def _docstring_summary(source: str) -> Optional[str]:
+    """
+    Text of the first triple-quoted docstring in source, up to its Args: section.
+
+    The Args section is regenerated from the parameters, so keeping it would
+    duplicate it. Plain str.find scans are enough here; no regex needed.
+    """
+    start = source.find('"""')
+    if start == -1:
+        return None
+    end = source.find('"""', start + 3)
+    if end == -1:
+        return None
+    lines = []
+    for line in source[start + 3:end].splitlines():
+        if line.strip() == "Args:":
+            break
+        lines.append(line)
+    return "\n".join(lines).strip() or None
 
 
 @mcp.tool()
@@ -13,6 +36,7 @@ def update_tool(
     description: Optional[str] = None,
     parameters: Optional[dict] = None,
     agent_name: Optional[str] = None,
+    defer_schemas: bool = False,
 ) -> dict:
     """
     Update an existing tool's description or parameters.
@@ -22,11 +46,13 @@ def update_tool(
         description: New description (optional)
         parameters: New parameters dict (optional, replaces all parameters)
         agent_name: Optional agent ID if not in agent directory
+        defer_schemas: Skip schema regeneration; call generate_schemas(force=True)
+            once after updating several tools
     """
     project_dir = get_project_dir(agent_name)
     tools_dir = project_dir / "tools"
 
-    if not tools_dir.exists():
+    if not os.path.isdir(tools_dir):
         return {
             "success": False,
             "error": f"tools/ directory not found at {tools_dir}",
@@ -34,9 +60,9 @@ def update_tool(
         }
 
     tool_file = tools_dir / f"{tool_name}.py"
-    if not tool_file.exists():
+    if not os.path.exists(tool_file):
         # List available tools for helpful error
-        available = [f.stem for f in tools_dir.glob("*.py") if f.stem != "__init__"]
+        available = list_tool_names(tools_dir)
         return {
             "success": False,
             "error": f"Tool '{tool_name}' not found",
@@ -56,12 +82,7 @@ def update_tool(
 
         # Extract current description from docstring if not provided
         if description is None:
-            import re
-            match = re.search(r'"""([^"]+)"""', current_content)
-            if match:
-                description = match.group(1).strip()
-            else:
-                description = f"Tool: {tool_name}"
+            description = _docstring_summary(current_content) or f"Tool: {tool_name}"
 
         # If parameters not provided, we need to extract from current file
         if parameters is None:
@@ -72,52 +93,28 @@ def update_tool(
                 "fix": "Provide the parameters dict with all parameters for the tool",
             }
 
-        # Prepare parameters with Python types (same logic as add_tool)
-        mapped_params = {}
-        type_mapping = {
-            "string": "str",
-            "number": "float",
-            "integer": "int",
-            "boolean": "bool",
-            "array": "List",
-            "object": "dict",
-        }
-
-        for name, info in parameters.items():
-            if isinstance(info, str):
-                param_info = {"type": info}
-            else:
-                param_info = info.copy()
-            raw_type = param_info.get("type", "Any")
-            py_type = type_mapping.get(raw_type, raw_type)
-            is_required = param_info.get("required", False)
-
-            if not is_required:
-                py_type = f"Optional[{py_type}] = None"
-
-            param_info["type"] = py_type
-            param_info["is_required"] = is_required
-            mapped_params[name] = param_info
-
-        sorted_params = dict(
-            sorted(mapped_params.items(), key=lambda x: (not x[1]["is_required"], x[0]))
-        )
+        sorted_params = map_tool_parameters(parameters)
 
         # Regenerate tool file
-        template = jinja_env.get_template("tool.py.j2")
+        template = get_tool_template()
         code = template.render(
             tool_name=tool_name, description=description, parameters=sorted_params
         )
-        tool_file.write_text(code)
-
-        # Regenerate schemas
-        from ..schemas import generate_schemas
-        generate_schemas(force=True, agent_name=agent_name)
+        tool_file.write_bytes(code.encode("utf-8"))
 
-        return {
+        result = {
             "success": True,
             "message": f"Updated tool '{tool_name}'",
             "path": str(tool_file),
         }
+
+        if defer_schemas:
+            result["next_steps"] = ["Run generate_schemas(force=True) after the last tool change"]
+        else:
+            # Regenerate schemas
+            from ..schemas import generate_schemas
+            generate_schemas(force=True, agent_name=agent_name)
+
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
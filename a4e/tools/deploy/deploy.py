@@ -17,16 +17,24 @@ def deploy(
     environment: str = "production",
     auto_publish: bool = False,
     agent_name: Optional[str] = None,
+    skip_validation: bool = False,
 ) -> dict:
     """
     Deploy agent to A4E Hub.
 
     This validates the agent, regenerates schemas, and prepares it for deployment.
     To test locally with the playground, use `dev_start` instead.
+
+    Args:
+        skip_validation: Set only when validate() has just passed for this agent;
+            the validation step is then not repeated
     """
-    val_result = validate(strict=True, agent_name=agent_name)
-    if not val_result["success"]:
-        return val_result
+    if skip_validation:
+        val_result = {"success": True, "message": "Validated by caller"}
+    else:
+        val_result = validate(strict=True, agent_name=agent_name)
+        if not val_result["success"]:
+            return val_result
 
     gen_result = generate_schemas(force=True, agent_name=agent_name)
 
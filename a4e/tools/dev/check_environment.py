@@ -5,10 +5,53 @@ Check environment tool.
 import sys
 import shutil
 import os
+import time
 from pathlib import Path
+from typing import Optional, Tuple
 
 from ...core import mcp, get_project_dir, get_configured_project_dir
 
+# How long ngrok probe results are reused before checking the system again
+_PROBE_TTL = 30.0
+_probe_cache: Optional[Tuple[float, str, dict]] = None
+
+
+def _probe_ngrok() -> dict:
+    """
+    Look for pyngrok, the ngrok binary and an ngrok auth config.
+
+    These need imports, a PATH search and config file reads, so results
+    are reused for _PROBE_TTL seconds, or until PATH changes.
+    """
+    global _probe_cache
+    now = time.monotonic()
+    path_env = os.environ.get("PATH", "")
+    if _probe_cache is not None:
+        stamp, cached_path, probe = _probe_cache
+        if cached_path == path_env and now - stamp < _PROBE_TTL:
+            return probe
+
+    probe = {"pyngrok_version": None, "ngrok_path": shutil.which("ngrok"), "auth_source": None}
+
+    try:
+        import pyngrok
+
+        probe["pyngrok_version"] = pyngrok.__version__
+        from pyngrok import conf
+
+        if conf.get_default().auth_token:
+            probe["auth_source"] = "config_file"
+    except ImportError:
+        config_path = Path.home() / ".ngrok2" / "ngrok.yml"
+        config_path_new = (
+            Path.home() / "Library/Application Support/ngrok/ngrok.yml"
+        )
+        if config_path.exists() or config_path_new.exists():
+            probe["auth_source"] = "config_file_detected"
+
+    _probe_cache = (now, path_env, probe)
+    return probe
+
 
 @mcp.tool()
 def check_environment() -> dict:
@@ -16,7 +59,8 @@ def check_environment() -> dict:
     Diagnose the current environment for agent development
     """
     _PROJECT_DIR = get_configured_project_dir()
-    
+    probe = _probe_ngrok()
+
     results = {
         "python": {
             "version": sys.version.split()[0],
@@ -34,16 +78,14 @@ def check_environment() -> dict:
     }
 
     # Check pyngrok
-    try:
-        import pyngrok
-
+    if probe["pyngrok_version"] is not None:
         results["dependencies"]["pyngrok"] = True
-        results["dependencies"]["message"] = f"Installed ({pyngrok.__version__})"
-    except ImportError:
+        results["dependencies"]["message"] = f"Installed ({probe['pyngrok_version']})"
+    else:
         results["recommendations"].append("Install pyngrok: 'uv add pyngrok'")
 
     # Check ngrok binary
-    ngrok_path = shutil.which("ngrok")
+    ngrok_path = probe["ngrok_path"]
     if ngrok_path:
         results["ngrok_binary"]["found"] = True
         results["ngrok_binary"]["path"] = ngrok_path
@@ -54,21 +96,9 @@ def check_environment() -> dict:
     if os.environ.get("NGROK_AUTHTOKEN"):
         results["ngrok_auth"]["configured"] = True
         results["ngrok_auth"]["source"] = "env_var"
-    else:
-        try:
-            from pyngrok import conf
-
-            if conf.get_default().auth_token:
-                results["ngrok_auth"]["configured"] = True
-                results["ngrok_auth"]["source"] = "config_file"
-        except ImportError:
-            config_path = Path.home() / ".ngrok2" / "ngrok.yml"
-            config_path_new = (
-                Path.home() / "Library/Application Support/ngrok/ngrok.yml"
-            )
-            if config_path.exists() or config_path_new.exists():
-                results["ngrok_auth"]["configured"] = True
-                results["ngrok_auth"]["source"] = "config_file_detected"
+    elif probe["auth_source"]:
+        results["ngrok_auth"]["configured"] = True
+        results["ngrok_auth"]["source"] = probe["auth_source"]
 
     if not results["ngrok_auth"]["configured"]:
         results["recommendations"].append(
@@ -76,4 +106,3 @@ def check_environment() -> dict:
         )
 
     return results
-
@@ -2,10 +2,39 @@
 Get agent info tool.
 """
 
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 import json
+import os
 
-from ...core import mcp, get_project_dir
+from ...core import mcp, get_project_dir, list_tool_names
+
+# Parsed metadata.json per path, with the (mtime_ns, size) it was read at
+_METADATA_CACHE: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+
+
+def _load_metadata(metadata_file: Path) -> dict:
+    """Parse metadata.json, reusing the last result while the file is unchanged.
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    st = metadata_file.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _METADATA_CACHE.get(metadata_file)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    metadata = json.loads(metadata_file.read_bytes())
+    _METADATA_CACHE[metadata_file] = (stamp, metadata)
+    return metadata
+
+
+def _scan(directory: Path) -> List[os.DirEntry]:
+    """Entries of directory from a single scandir pass; empty if it can't be read."""
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except OSError:
+        return []
 
 
 @mcp.tool()
@@ -16,13 +45,13 @@ def get_agent_info(agent_name: Optional[str] = None) -> dict:
     project_dir = get_project_dir(agent_name)
     metadata_file = project_dir / "metadata.json"
 
-    if not metadata_file.exists():
+    if not os.path.exists(metadata_file):
         return {
             "error": f"metadata.json not found in {project_dir}. Are you in an agent project?"
         }
 
     try:
-        metadata = json.loads(metadata_file.read_text())
+        metadata = _load_metadata(metadata_file)
 
         # Count structure
         tools_dir = project_dir / "tools"
@@ -30,21 +59,17 @@ def get_agent_info(agent_name: Optional[str] = None) -> dict:
         skills_dir = project_dir / "skills"
         prompts_dir = project_dir / "prompts"
 
-        tools = []
-        if tools_dir.exists():
-            tools = [f.stem for f in tools_dir.glob("*.py") if f.stem != "__init__"]
-
-        views = []
-        if views_dir.exists():
-            views = [d.name for d in views_dir.iterdir() if d.is_dir() and (d / "view.tsx").exists()]
-
-        skills = []
-        if skills_dir.exists():
-            skills = [d.name for d in skills_dir.iterdir() if d.is_dir()]
+        tools = list_tool_names(tools_dir)
 
-        prompts = []
-        if prompts_dir.exists():
-            prompts = [f.stem for f in prompts_dir.glob("*.md")]
+        views = [
+            e.name for e in _scan(views_dir)
+            if e.is_dir() and os.path.isfile(os.path.join(e.path, "view.tsx"))
+        ]
+        skills = [e.name for e in _scan(skills_dir) if e.is_dir()]
+        prompts = [
+            e.name[:-3] for e in _scan(prompts_dir)
+            if e.name.endswith(".md") and e.is_file()
+        ]
 
         return {
             "agent_id": project_dir.name,
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Literal, Optional
 import os
 
-from ...core import mcp, jinja_env, sanitize_input, get_project_dir, get_configured_project_dir
+from ...core import mcp, get_jinja_env, sanitize_input, get_project_dir, get_configured_project_dir
 
 
 @mcp.tool()
@@ -65,6 +65,8 @@ def initialize_project(
         (project_dir / "views").mkdir(exist_ok=True)
         (project_dir / "skills").mkdir(exist_ok=True)
 
+        jinja_env = get_jinja_env()
+
         # Sanitize inputs before template rendering
         safe_name = sanitize_input(name)
 
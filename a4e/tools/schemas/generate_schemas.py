@@ -2,7 +2,6 @@
 Schema generation tool.
 """
 
-from pathlib import Path
 from typing import Optional
 import json
 import inspect
@@ -28,16 +27,8 @@ def generate_schemas(force: bool = False, agent_name: Optional[str] = None) -> d
     - views/*/view.schema.json (from TypeScript props)
     - views/schemas.json (aggregated summary for backend)
     """
-    # Import schema_generator dynamically from utils directory
-    schema_gen_path = Path(__file__).parent.parent.parent / "utils" / "schema_generator.py"
-    spec = importlib.util.spec_from_file_location("schema_generator", schema_gen_path)
-    if not spec or not spec.loader:
-        return {"success": False, "error": "Failed to load schema_generator module"}
-    schema_gen_module = importlib.util.module_from_spec(spec)
-    # Add module to sys.modules before executing to enable imports
-    sys.modules[spec.name] = schema_gen_module
-    spec.loader.exec_module(schema_gen_module)
-    generate_schema = schema_gen_module.generate_schema
+    # Imported here so only schema generation pays for it; sys.modules caches it
+    from ...utils.schema_generator import generate_schema
 
     project_dir = get_project_dir(agent_name)
     tools_dir = project_dir / "tools"
@@ -6,7 +6,7 @@ from pathlib import Path
 import json
 from typing import List, Optional
 
-from ...core import jinja_env
+from ...core import get_jinja_env
 
 
 def create_skill(
@@ -59,7 +59,7 @@ def create_skill(
         skill_name = name or " ".join(word.title() for word in skill_id.split("_"))
 
         # Generate SKILL.md
-        template = jinja_env.get_template("skills/skill.md.j2")
+        template = get_jinja_env().get_template("skills/skill.md.j2")
         skill_md = template.render(
             skill_name=skill_name,
             description=description,
@@ -4,6 +4,7 @@ List skills tool.
 
 from typing import Optional
 import json
+import os
 
 from ...core import mcp, get_project_dir
 
@@ -16,14 +17,14 @@ def list_skills(agent_name: Optional[str] = None) -> dict:
     project_dir = get_project_dir(agent_name)
     skills_dir = project_dir / "skills"
 
-    if not skills_dir.exists():
+    if not os.path.isdir(skills_dir):
         return {"skills": [], "count": 0}
 
     skills = []
     
     # Read from schemas.json if exists
     schema_file = skills_dir / "schemas.json"
-    if schema_file.exists():
+    if os.path.exists(schema_file):
         try:
             schemas = json.loads(schema_file.read_text())
             for skill_id, skill_data in schemas.items():
@@ -41,7 +42,7 @@ def list_skills(agent_name: Optional[str] = None) -> dict:
     # Fallback: list directories with SKILL.md
     if not skills:
         for skill_dir in skills_dir.iterdir():
-            if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
+            if skill_dir.is_dir() and os.path.exists(skill_dir / "SKILL.md"):
                 skills.append({
                     "id": skill_dir.name,
                     "name": skill_dir.name.replace("_", " ").title(),
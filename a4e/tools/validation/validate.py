@@ -7,7 +7,7 @@ from collections import defaultdict
 import ast
 import json
 
-from ...core import mcp, get_project_dir
+from ...core import mcp, get_project_dir, list_tool_names
 
 
 @mcp.tool()
@@ -46,18 +46,16 @@ def validate(strict: bool = True, agent_name: Optional[str] = None) -> dict:
 
     if strict:
         # 1. Check Python syntax and type hints
-        python_files = [project_dir / "agent.py"]
+        # One listing of tools/ serves both the syntax and the schema checks
         tools_dir = project_dir / "tools"
-        if tools_dir.exists():
-            python_files.extend(list(tools_dir.glob("*.py")))
+        tool_names = list_tool_names(tools_dir)
+        python_files = [project_dir / "agent.py"]
+        python_files.extend(tools_dir / f"{name}.py" for name in tool_names)
 
         for py_file in python_files:
-            if py_file.name == "__init__.py":
-                continue
-
             try:
-                content = py_file.read_text()
-                tree = ast.parse(content)
+                # ast.parse decodes the bytes itself, honouring any coding cookie
+                tree = ast.parse(py_file.read_bytes())
 
                 # Check type hints in functions
                 for node in ast.walk(tree):
@@ -79,8 +77,7 @@ def validate(strict: bool = True, agent_name: Optional[str] = None) -> dict:
                 errors.append(f"Error analyzing {py_file.name}: {e}")
 
         # 2. Check if schemas exist (basic check)
-        tool_files = [f for f in tools_dir.glob("*.py") if f.name != "__init__.py"]
-        if not (tools_dir / "schemas.json").exists() and tool_files:
+        if tool_names and not (tools_dir / "schemas.json").exists():
             errors.append(
                 "Tools exist but tools/schemas.json is missing. Run generate_schemas."
             )
@@ -5,7 +5,7 @@ Helper functions for view management.
 import json
 from pathlib import Path
 
-from ...core import jinja_env
+from ...core import get_jinja_env
 
 
 def create_view(
@@ -42,7 +42,7 @@ def create_view(
         view_name = "".join(word.title() for word in view_id.split("_"))
 
         # Create view.tsx
-        template = jinja_env.get_template("view.tsx.j2")
+        template = get_jinja_env().get_template("view.tsx.j2")
         code = template.render(
             view_name=view_name, description=description, props=props
         )
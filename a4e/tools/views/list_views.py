@@ -3,6 +3,7 @@ List views tool.
 """
 
 from typing import Optional
+import os
 
 from ...core import mcp, get_project_dir
 
@@ -15,12 +16,12 @@ def list_views(agent_name: Optional[str] = None) -> dict:
     project_dir = get_project_dir(agent_name)
     views_dir = project_dir / "views"
 
-    if not views_dir.exists():
+    if not os.path.isdir(views_dir):
         return {"views": [], "count": 0}
 
     views = []
     for view_dir in views_dir.iterdir():
-        if view_dir.is_dir() and (view_dir / "view.tsx").exists():
+        if view_dir.is_dir() and os.path.exists(view_dir / "view.tsx"):
             views.append(view_dir.name)
 
     return {"views": sorted(views), "count": len(views)}
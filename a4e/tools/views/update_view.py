@@ -5,7 +5,7 @@ Update view - modify existing view's description or props.
 import json
 from typing import Optional
 
-from ...core import mcp, jinja_env, get_project_dir
+from ...core import mcp, get_jinja_env, get_project_dir
 
 
 @mcp.tool()
@@ -77,7 +77,7 @@ def update_view(
         view_name = "".join(word.title() for word in view_id.split("_"))
 
         # Regenerate view.tsx
-        template = jinja_env.get_template("view.tsx.j2")
+        template = get_jinja_env().get_template("view.tsx.j2")
         code = template.render(view_name=view_name, description=description, props=props)
         (view_dir / "view.tsx").write_text(code)
 
@@ -0,0 +1,39 @@
+"""
+JSON encode/decode helpers shared by the CLI and the MCP tools.
+
+orjson is used when it is installed; the stdlib json module is the fallback.
+Both paths produce the same bytes for the same data.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def parse_json(data: Union[str, bytes]) -> Any:
+    """Decode JSON text or bytes.
+
+    Raises ValueError on malformed input with either decoder.
+    """
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def dump_json(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON bytes, compact or indented by two spaces.
+
+    Non-ASCII text is written as raw UTF-8, as orjson does.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            pass  # data orjson can't serialize: use the stdlib encoder below
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")